@@ -134,6 +134,9 @@ SCHEMA_STORE = SchemaStore()
 config validation.
 """
 
+_VALIDATORS: dict[str, jsonschema.Draft202012Validator] = {}
+"""Cache of the (stateless and reusable) validators for each of the schemas."""
+
 
 class ConfigSchema(Enum):
     """An enum to help describe schema types and help validate configs against them."""
@@ -228,6 +231,17 @@ class ConfigSchema(Enum):
         assert schema
         return schema
 
+    @property
+    def validator(self) -> jsonschema.Draft202012Validator:
+        """Gets the (cached) validator object for this schema type."""
+        validator = _VALIDATORS.get(self.value)
+        if validator is None:
+            validator = _VALIDATORS[self.value] = jsonschema.Draft202012Validator(
+                schema=self.schema,
+                registry=SCHEMA_STORE.registry,
+            )
+        return validator
+
     def validate(self, config: dict) -> None:
         """
         Validates the given config against this schema.
@@ -247,7 +261,4 @@ class ConfigSchema(Enum):
         if _SKIP_VALIDATION:
             _LOG.warning("%s is set - skip schema validation", VALIDATION_ENV_FLAG)
         else:
-            jsonschema.Draft202012Validator(
-                schema=self.schema,
-                registry=SCHEMA_STORE.registry,
-            ).validate(config)
+            self.validator.validate(config)
@@ -254,7 +254,8 @@ class CompositeEnv(Environment):
             if not status.is_good() and final_status is None:
                 final_status = status
 
-        final_status = final_status or status
+        if final_status is None:
+            final_status = status
         _LOG.info("Final status: %s :: %s", self, final_status)
         # Return the status and the timestamp of the last child environment or the
         # first failed child environment.
@@ -14,6 +14,7 @@ import sys
 from collections.abc import Iterable, Mapping
 from contextlib import nullcontext
 from datetime import datetime
+from io import BytesIO
 from tempfile import TemporaryDirectory
 from types import TracebackType
 from typing import Any, Literal
@@ -211,21 +212,32 @@ class LocalEnv(ScriptEnv):
                 "Local results have (metric,value) header and %d rows: assume long format",
                 len(data),
             )
-            data = pandas.DataFrame([data.value.to_list()], columns=data.metric.to_list())
+            # Pivot the long format directly into the results dict (no need to
+            # build another one-row DataFrame for that).
             # Try to convert string metrics to numbers.
-            data = data.apply(
-                pandas.to_numeric,
-                errors="coerce",
-            ).fillna(data)
+            stdout_data.update(
+                (metric, self._to_numeric(value))
+                for (metric, value) in zip(data.metric.to_list(), data.value.to_list())
+            )
         elif len(data) == 1:
             _LOG.info("Local results have 1 row: assume wide format")
+            stdout_data.update(data.iloc[-1].to_dict())
         else:
             raise ValueError(f"Invalid data format: {data}")
 
-        stdout_data.update(data.iloc[-1].to_dict())
         _LOG.info("Local run complete: %s ::\n%s", self, stdout_data)
         return (Status.SUCCEEDED, timestamp, stdout_data)
 
+    @staticmethod
+    def _to_numeric(value: Any) -> Any:
+        """Convert a string value to a number the same way `pandas.to_numeric` does, or
+        keep it as is if it does not look like a number.
+        """
+        if not isinstance(value, str):
+            return value
+        num = pandas.to_numeric(value, errors="coerce")
+        return value if pandas.isna(num) else num
+
     @staticmethod
     def _normalize_columns(data: pandas.DataFrame) -> pandas.DataFrame:
         """Strip trailing spaces from column names (Windows only)."""
@@ -253,7 +265,11 @@ class LocalEnv(ScriptEnv):
 
             # FIXME: We should not be assuming that the only output file type is a CSV.
 
-            data = self._normalize_columns(pandas.read_csv(fname, index_col=False))
+            # Read the file only once and (re)parse it from memory.
+            with open(fname, "rb") as fh_telemetry:
+                raw_data = fh_telemetry.read()
+
+            data = self._normalize_columns(pandas.read_csv(BytesIO(raw_data), index_col=False))
             data.iloc[:, 0] = datetime_parser(data.iloc[:, 0], origin="local")
 
             expected_col_names = ["timestamp", "metric", "value"]
@@ -262,7 +278,11 @@ class LocalEnv(ScriptEnv):
 
             if list(data.columns) != expected_col_names:
                 # Assume no header - this is ok for telemetry data.
-                data = pandas.read_csv(fname, index_col=False, names=expected_col_names)
+                data = pandas.read_csv(
+                    BytesIO(raw_data),
+                    index_col=False,
+                    names=expected_col_names,
+                )
                 data.iloc[:, 0] = datetime_parser(data.iloc[:, 0], origin="local")
 
         except FileNotFoundError as ex:
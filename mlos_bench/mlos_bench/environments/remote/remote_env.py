@@ -27,6 +27,9 @@ from mlos_bench.tunables.tunable_types import TunableValue
 
 _LOG = logging.getLogger(__name__)
 
+# Statuses of the submitted remote command that require fetching the results.
+_REMOTE_EXEC_SUBMITTED = frozenset({Status.PENDING, Status.SUCCEEDED})
+
 
 class RemoteEnv(ScriptEnv):
     """
@@ -198,7 +201,7 @@ class RemoteEnv(ScriptEnv):
             env_params=env_params,
         )
         _LOG.debug("Script submitted: %s %s :: %s", self, status, output)
-        if status in {Status.PENDING, Status.SUCCEEDED}:
+        if status in _REMOTE_EXEC_SUBMITTED:
             (status, output) = self._remote_exec_service.get_remote_exec_results(output)
         _LOG.debug("Status: %s :: %s", status, output)
         # FIXME: get the timestamp from the remote environment!
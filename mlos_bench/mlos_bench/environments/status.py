@@ -7,9 +7,19 @@
 import enum
 
 
-class Status(enum.Enum):
+class Status(enum.IntEnum):
     """Enum for the status of the benchmark/environment Trial or Experiment."""
 
+    # Keep the `Status.NAME` string representation of the regular Enum
+    # (IntEnum would otherwise format the members as plain ints).
+    __str__ = enum.Enum.__str__
+    __format__ = enum.Enum.__format__
+
+    def __bool__(self) -> bool:
+        # Keep the truthiness of the regular Enum members, too
+        # (IntEnum would otherwise make `Status.UNKNOWN == 0` falsy).
+        return True
+
     UNKNOWN = 0
     PENDING = 1
     READY = 2
@@ -21,23 +31,13 @@ class Status(enum.Enum):
 
     def is_good(self) -> bool:
         """Check if the status of the benchmark/environment is good."""
-        return self in {
-            Status.PENDING,
-            Status.READY,
-            Status.RUNNING,
-            Status.SUCCEEDED,
-        }
+        return self in _GOOD_STATUSES
 
     def is_completed(self) -> bool:
         """Check if the status of the benchmark/environment Trial or Experiment is one
         of {SUCCEEDED, CANCELED, FAILED, TIMED_OUT}.
         """
-        return self in {
-            Status.SUCCEEDED,
-            Status.CANCELED,
-            Status.FAILED,
-            Status.TIMED_OUT,
-        }
+        return self in _COMPLETED_STATUSES
 
     def is_pending(self) -> bool:
         """Check if the status of the benchmark/environment Trial or Experiment is
@@ -74,3 +74,22 @@ class Status(enum.Enum):
         TIMED_OUT.
         """
         return self == Status.FAILED
+
+
+_GOOD_STATUSES = frozenset(
+    {
+        Status.PENDING,
+        Status.READY,
+        Status.RUNNING,
+        Status.SUCCEEDED,
+    }
+)
+
+_COMPLETED_STATUSES = frozenset(
+    {
+        Status.SUCCEEDED,
+        Status.CANCELED,
+        Status.FAILED,
+        Status.TIMED_OUT,
+    }
+)
@@ -449,29 +449,21 @@ class Launcher:
         _LOG.debug("Extra args: %s", cmdline)
 
         config: dict[str, TunableValue] = {}
-        key = None
-        for elem in cmdline:
-            if elem.startswith("--"):
-                if key is not None:
+        tokens = iter(cmdline)
+        for elem in tokens:
+            if not elem.startswith("--"):
+                raise ValueError("Command line argument has no key: " + elem)
+            (key, sep, val) = elem[2:].partition("=")
+            if not sep:
+                # Value is the next token (e.g., `--key value`).
+                next_elem = next(tokens, None)
+                if next_elem is None or next_elem.startswith("--"):
                     raise ValueError("Command line argument has no value: " + key)
-                key = elem[2:]
-                kv_split = key.split("=", 1)
-                if len(kv_split) == 2:
-                    config[kv_split[0].strip()] = try_parse_val(kv_split[1])
-                    key = None
-            else:
-                if key is None:
-                    raise ValueError("Command line argument has no key: " + elem)
-                config[key.strip()] = try_parse_val(elem)
-                key = None
-
-        if key is not None:
-            # Handles missing trailing elem from last --key arg.
-            raise ValueError("Command line argument has no value: " + key)
-
-        # Convert "max-suggestions" to "max_suggestions" for compatibility with
-        # other CLI options to use as common python/json variable replacements.
-        config = {k.replace("-", "_"): v for k, v in config.items()}
+                val = next_elem
+            # Convert "max-suggestions" to "max_suggestions" for compatibility with
+            # other CLI options to use as common python/json variable replacements.
+            # Keys are interned since they get looked up in the global config a lot.
+            config[sys.intern(key.strip().replace("-", "_"))] = try_parse_val(val)
 
         _LOG.debug("Parsed config: %s", config)
         return config
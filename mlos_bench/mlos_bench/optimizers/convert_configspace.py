@@ -22,7 +22,8 @@ from ConfigSpace import (
     Normal,
     Uniform,
 )
-from ConfigSpace.hyperparameters import NumericalHyperparameter
+from ConfigSpace.conditions import ConditionLike
+from ConfigSpace.hyperparameters import Hyperparameter, NumericalHyperparameter
 from ConfigSpace.types import NotSet
 
 from mlos_bench.tunables.tunable import Tunable
@@ -207,17 +208,21 @@ def tunable_groups_to_configspace(
     configspace : ConfigSpace.ConfigurationSpace
         A new ConfigurationSpace instance that corresponds to the input TunableGroups.
     """
-    space = ConfigurationSpace(seed=seed)
+    # Collect all hyperparameters and conditions first and add them in one batch:
+    # merging the per-tunable spaces one at a time re-validates the whole
+    # (growing) space on every call.
+    hyperparameters: list[Hyperparameter] = []
+    conditions: list[ConditionLike] = []
     for tunable, group in tunables:
-        space.add_configuration_space(
-            prefix="",
-            delimiter="",
-            configuration_space=_tunable_to_configspace(
-                tunable,
-                group.name,
-                group.get_current_cost(),
-            ),
+        tunable_space = _tunable_to_configspace(
+            tunable,
+            group.name,
+            group.get_current_cost(),
         )
+        hyperparameters.extend(tunable_space.values())
+        conditions.extend(tunable_space.conditions)
+    space = ConfigurationSpace(seed=seed)
+    space.add(hyperparameters, conditions)
     return space
 
 
@@ -138,10 +138,11 @@ Examples
 
 import logging
 import os
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from types import TracebackType
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
+import numpy as np
 import pandas as pd
 
 from mlos_bench.environments.status import Status
@@ -153,18 +154,19 @@ from mlos_bench.optimizers.convert_configspace import (
 )
 from mlos_bench.services.base_service import Service
 from mlos_bench.tunables.tunable_groups import TunableGroups
-from mlos_bench.tunables.tunable_types import TunableValue
+from mlos_bench.tunables.tunable_types import TunableValue, TunableValueType
 from mlos_core.data_classes import Observations
-from mlos_core.optimizers import (
-    DEFAULT_OPTIMIZER_TYPE,
-    BaseOptimizer,
-    OptimizerFactory,
-    OptimizerType,
-    SpaceAdapterType,
-)
+
+if TYPE_CHECKING:
+    from mlos_core.optimizers import BaseOptimizer
 
 _LOG = logging.getLogger(__name__)
 
+_COMPLETED_STATUS_CODES = np.array(
+    [status for status in Status if status.is_completed()],
+    dtype=np.int64,
+)
+
 
 class MlosCoreOptimizer(Optimizer):
     """A wrapper class for the mlos_core optimizers."""
@@ -178,6 +180,16 @@ class MlosCoreOptimizer(Optimizer):
     ):
         super().__init__(tunables, config, global_config, service)
 
+        # pylint: disable=import-outside-toplevel
+        # Importing mlos_core.optimizers pulls in the (heavy) optimizer backends,
+        # so defer it until an MlosCoreOptimizer is actually instantiated.
+        from mlos_core.optimizers import (
+            DEFAULT_OPTIMIZER_TYPE,
+            OptimizerFactory,
+            OptimizerType,
+            SpaceAdapterType,
+        )
+
         opt_type = getattr(
             OptimizerType, self._config.pop("optimizer_type", DEFAULT_OPTIMIZER_TYPE.name)
         )
@@ -216,7 +228,20 @@ class MlosCoreOptimizer(Optimizer):
                 # not currently exposed in the config schema.
                 space_adapter_config["use_approximate_reverse_mapping"] = True
 
-        self._opt: BaseOptimizer = OptimizerFactory.create(
+        # Target dtypes of the tunables columns, used to coerce the external data.
+        self._tunables_dtypes: dict[str, TunableValueType] = {
+            tunable.name: tunable.dtype for (tunable, _group) in self._tunables
+        }
+        # Names of the dataframe columns passed to the optimizer, including the
+        # extra columns for the tunables with special values.
+        df_columns = list(self._tunables_dtypes)
+        for tunable, _group in self._tunables:
+            if tunable.special:
+                df_columns += special_param_names(tunable.name)
+        # By default, hyperparameters in ConfigurationSpace are sorted by name:
+        self._df_columns: list[str] = sorted(df_columns)
+
+        self._opt: "BaseOptimizer" = OptimizerFactory.create(
             parameter_space=self.config_space,
             optimization_targets=list(self._opt_targets),
             optimizer_type=opt_type,
@@ -225,6 +250,11 @@ class MlosCoreOptimizer(Optimizer):
             space_adapter_kwargs=space_adapter_config,
         )
 
+        # Observations from `.register()` that have not been passed to the
+        # underlying optimizer yet (see `._flush_pending()`).
+        self._pending_configs: list[dict[str, TunableValue]] = []
+        self._pending_scores: list[dict[str, float]] = []
+
     def __exit__(
         self,
         ex_type: type[BaseException] | None,
@@ -248,21 +278,24 @@ class MlosCoreOptimizer(Optimizer):
         if not super().bulk_register(configs, scores, status):
             return False
 
+        self._flush_pending()  # Keep the order of the observations.
+
         df_configs = self._to_df(configs)  # Impute missing values, if necessary
 
-        df_scores = self._adjust_signs_df(
-            pd.DataFrame([{} if score is None else score for score in scores])
-        )
+        df_scores = self._scores_to_df(scores)
 
         if status is not None:
             # Select only the completed trials, set scores for failed trials to +inf.
-            df_status = pd.Series(status)
+            # Status is an IntEnum, so convert it to an array of ints in one pass
+            # and compute both masks with vectorized numpy ops.
+            status_codes = np.fromiter(status, dtype=np.int64, count=len(status))
+            is_succeeded = status_codes == Status.SUCCEEDED
+            is_completed = np.isin(status_codes, _COMPLETED_STATUS_CODES)
             # TODO: Be more flexible with values used for failed trials (not just +inf).
             # Issue: https://github.com/microsoft/MLOS/issues/523
-            df_scores[df_status != Status.SUCCEEDED] = float("inf")
-            df_status_completed = df_status.apply(Status.is_completed)
-            df_configs = df_configs[df_status_completed]
-            df_scores = df_scores[df_status_completed]
+            df_scores.loc[~is_succeeded] = float("inf")
+            df_configs = df_configs.iloc[is_completed]
+            df_scores = df_scores.iloc[is_completed]
 
         # TODO: Specify (in the config) which metrics to pass to the optimizer.
         # Issue: https://github.com/microsoft/MLOS/issues/745
@@ -274,20 +307,40 @@ class MlosCoreOptimizer(Optimizer):
 
         return True
 
-    def _adjust_signs_df(self, df_scores: pd.DataFrame) -> pd.DataFrame:
-        """Coerce optimization target scores to floats and adjust the signs for
-        MINIMIZATION problem.
+    def _scores_to_df(
+        self,
+        scores: Sequence[Mapping[str, TunableValue | None] | None],
+    ) -> pd.DataFrame:
+        """
+        Coerce the optimization target scores into a dataframe of floats with the signs
+        adjusted for MINIMIZATION problem (or back, as the operation is symmetric).
+
+        Missing (None) scores and missing or None values of the targets become NaN.
         """
-        df_targets = df_scores[list(self._opt_targets)]
+        targets = list(self._opt_targets)
         try:
-            return df_targets.astype(float) * self._opt_targets.values()
+            # Build the float64 buffer directly and flip the signs in-place
+            # rather than going through an intermediate object DataFrame.
+            arr_scores = np.array(
+                [
+                    (
+                        [None] * len(targets)
+                        if score is None
+                        else [score.get(name) for name in targets]
+                    )
+                    for score in scores
+                ],
+                dtype=np.float64,
+            ).reshape(len(scores), len(targets))
         except ValueError as ex:
             _LOG.error(
                 "Some score values cannot be converted to float - check the data ::\n%s",
-                df_targets,
+                scores,
                 exc_info=True,
             )
             raise ValueError("Some score values cannot be converted to float") from ex
+        arr_scores *= np.array(list(self._opt_targets.values()), dtype=np.float64)
+        return pd.DataFrame(arr_scores, columns=targets, copy=False)
 
     def _to_df(self, configs: Sequence[dict[str, TunableValue]]) -> pd.DataFrame:
         """
@@ -304,20 +357,22 @@ class MlosCoreOptimizer(Optimizer):
         df_configs : pd.DataFrame
             A dataframe with past trials data, with missing values imputed.
         """
-        df_configs = pd.DataFrame(configs)
-        tunables_names = list(self._tunables.get_param_values().keys())
-        missing_cols = set(tunables_names).difference(df_configs.columns)
+        tunables_names = list(self._tunables_dtypes.keys())
+        df_configs = pd.DataFrame.from_records(configs, columns=tunables_names)
+        missing_cols = set(tunables_names).difference(*configs)
+        defaults: dict[str, TunableValue] = {}
         for tunable, _group in self._tunables:
             if tunable.name in missing_cols:
                 df_configs[tunable.name] = tunable.default
             else:
-                df_configs.fillna({tunable.name: tunable.default}, inplace=True)
-            # External data can have incorrect types (e.g., all strings).
-            df_configs[tunable.name] = df_configs[tunable.name].astype(tunable.dtype)
+                defaults[tunable.name] = tunable.default
+        df_configs.fillna(defaults, inplace=True)
+        # External data can have incorrect types (e.g., all strings).
+        df_configs = df_configs.astype(self._tunables_dtypes)
+        for tunable, _group in self._tunables:
             # Add columns for tunables with special values.
             if tunable.special:
                 (special_name, type_name) = special_param_names(tunable.name)
-                tunables_names += [special_name, type_name]
                 is_special = df_configs[tunable.name].apply(tunable.special.__contains__)
                 df_configs[type_name] = TunableValueKind.RANGE.value
                 df_configs.loc[is_special, type_name] = TunableValueKind.SPECIAL.value
@@ -327,8 +382,7 @@ class MlosCoreOptimizer(Optimizer):
                 df_configs[special_name] = df_configs[tunable.name]
                 df_configs.loc[~is_special, special_name] = None
                 df_configs.loc[is_special, tunable.name] = None
-        # By default, hyperparameters in ConfigurationSpace are sorted by name:
-        df_configs = df_configs[sorted(tunables_names)]
+        df_configs = df_configs[self._df_columns]
         _LOG.debug("Loaded configs:\n%s", df_configs)
         return df_configs
 
@@ -336,10 +390,14 @@ class MlosCoreOptimizer(Optimizer):
         tunables = super().suggest()
         if self._start_with_defaults:
             _LOG.info("Use default values for the first trial")
+        self._flush_pending()
         suggestion = self._opt.suggest(defaults=self._start_with_defaults)
         self._start_with_defaults = False
-        _LOG.info("Iteration %d :: Suggest:\n%s", self._iter, suggestion.config)
-        return tunables.assign(configspace_data_to_tunable_values(suggestion.config.to_dict()))
+        # Log the plain dict rather than the pandas object: formatting a Series
+        # (column alignment, dtype inference) on every trial is not free.
+        config = suggestion.config.to_dict()
+        _LOG.info("Iteration %d :: Suggest: %s", self._iter, config)
+        return tunables.assign(configspace_data_to_tunable_values(config))
 
     def register(
         self,
@@ -354,25 +412,46 @@ class MlosCoreOptimizer(Optimizer):
         )  # Sign-adjusted for MINIMIZATION
         if status.is_completed():
             assert registered_score is not None
-            df_config = self._to_df([tunables.get_param_values()])
-            _LOG.debug("Score: %s Dataframe:\n%s", registered_score, df_config)
-            # TODO: Specify (in the config) which metrics to pass to the optimizer.
-            # Issue: https://github.com/microsoft/MLOS/issues/745
-            self._opt.register(
-                observations=Observations(
-                    configs=df_config,
-                    scores=pd.DataFrame([registered_score], dtype=float),
-                )
-            )
+            config = tunables.get_param_values()
+            # Validate the config against our tunables here, so that bad data gets
+            # reported to the caller instead of failing a later (batched) flush.
+            for tunable, _group in self._tunables:
+                value = config.get(tunable.name)
+                if value is not None and not tunable.is_valid(value):
+                    raise ValueError(f"Invalid value for the tunable: {tunable.name}={value}")
+            # Buffer the observation and pass it to the underlying optimizer (in a
+            # batch with the others) only when it is needed, instead of converting
+            # every single observation into a one-row dataframe.
+            self._pending_configs.append(config)
+            self._pending_scores.append(registered_score)
         return registered_score
 
+    def _flush_pending(self) -> None:
+        """Register all buffered observations with the underlying optimizer."""
+        if not self._pending_configs:
+            return
+        # Empty the buffers first, so that a failure to register these observations
+        # is only raised once and does not break all subsequent calls.
+        (configs, scores) = (self._pending_configs, self._pending_scores)
+        self._pending_configs = []
+        self._pending_scores = []
+        df_configs = self._to_df(configs)
+        df_scores = pd.DataFrame(scores, dtype=float)
+        _LOG.debug("Scores:\n%s Dataframe:\n%s", df_scores, df_configs)
+        # TODO: Specify (in the config) which metrics to pass to the optimizer.
+        # Issue: https://github.com/microsoft/MLOS/issues/745
+        self._opt.register(observations=Observations(configs=df_configs, scores=df_scores))
+
     def get_best_observation(
         self,
     ) -> tuple[dict[str, float], TunableGroups] | tuple[None, None]:
+        self._flush_pending()
         best_observations = self._opt.get_best_observations()
         if len(best_observations) == 0:
             return (None, None)
         params = configspace_data_to_tunable_values(best_observations.configs.iloc[0].to_dict())
-        scores = self._adjust_signs_df(best_observations.scores).iloc[0].to_dict()
+        # Restore the original signs of the scores.
+        df_scores = self._scores_to_df(best_observations.scores.iloc[:1].to_dict("records"))
+        scores = df_scores.iloc[0].to_dict()
         _LOG.debug("Best observation: %s score: %s", params, scores)
         return (scores, self._tunables.copy().assign(params))
@@ -12,9 +12,12 @@ See Also
 mlos_bench.config : Overview of the configuration system.
 """
 
+import copy
+import json as _json
 import logging
 import os
 from collections.abc import Callable, Iterable
+from functools import lru_cache
 from importlib.resources import files
 from typing import TYPE_CHECKING, Any
 
@@ -43,6 +46,44 @@ if TYPE_CHECKING:
 
 _LOG = logging.getLogger(__name__)
 
+_json_loads: Callable[[str | bytes], Any]
+try:
+    # Optional: orjson is faster than the stdlib json parser, if available.
+    from orjson import loads as _orjson_loads
+
+    _json_loads = _orjson_loads
+except ImportError:
+    _json_loads = _json.loads
+
+
+def _parse_json5(text: str | bytes) -> Any:
+    """
+    Parse a JSON5 string.
+
+    Many config files are plain JSON, so try the (much faster) native JSON
+    parser first and only fall back to the pure-python JSON5 parser for the
+    files that use JSON5 extensions (comments, trailing commas, etc.).
+    """
+    try:
+        return _json_loads(text)
+    except ValueError:
+        return json5.loads(text.decode("utf-8") if isinstance(text, bytes) else text)
+
+
+@lru_cache(maxsize=1024)
+def _load_config_file(file_path: str, mtime_ns: int) -> Any:
+    """
+    Parse the JSON5 config file and cache the result.
+
+    Parsing JSON5 is relatively slow, and the same config files are often
+    loaded many times (e.g., by several Environments or Launcher instances).
+    The modification time is part of the cache key, so the files that change
+    on disk get re-parsed. Callers must not modify the returned object.
+    """
+    _LOG.debug("Parse config file: %s (mtime: %d)", file_path, mtime_ns)
+    with open(file_path, "rb") as fh_json:
+        return _parse_json5(fh_json.read())
+
 
 class ConfigPersistenceService(Service, SupportsConfigLoading):
     """Collection of methods to deserialize the Environment, Service, and TunableGroups
@@ -109,6 +150,8 @@ class ConfigPersistenceService(Service, SupportsConfigLoading):
         # Append the built-in config path if not already on the list.
         if self.BUILTIN_CONFIG_PATH not in self._config_path:
             self._config_path.append(self.BUILTIN_CONFIG_PATH)
+        # Cache of the (relative) paths already resolved against the config paths.
+        self._resolved_paths: dict[str, str] = {}
 
     @property
     def config_paths(self) -> list[str]:
@@ -155,10 +198,21 @@ class ConfigPersistenceService(Service, SupportsConfigLoading):
         if os.path.isabs(file_path):
             _LOG.debug("Path is absolute: %s", file_path)
             return file_path
+        # Only cache the successful lookups in the (fixed) config paths:
+        # the extra paths are typically temp dirs where the files come and go,
+        # and a file we did not find could be created later.
+        use_cache = not extra_paths
+        if use_cache:
+            full_path = self._resolved_paths.get(file_path)
+            if full_path is not None and os.path.exists(full_path):
+                _LOG.debug("Path resolved (cached): %s", full_path)
+                return full_path
         for path in path_list:
             full_path = path_join(path, file_path, abs_path=True)
             if os.path.exists(full_path):
                 _LOG.debug("Path resolved: %s", full_path)
+                if use_cache:
+                    self._resolved_paths[file_path] = full_path
                 return full_path
         _LOG.debug("Path not resolved: %s", file_path)
         return file_path
@@ -192,15 +246,17 @@ class ConfigPersistenceService(Service, SupportsConfigLoading):
             # so just parse it.
             _LOG.info("Load config from json string: %s", json)
             try:
-                config: Any = json5.loads(json)
+                config: Any = _parse_json5(json)
             except ValueError as ex:
                 _LOG.error("Failed to parse config from JSON string: %s", json)
                 raise ValueError(f"Failed to parse config from JSON string: {json}") from ex
         else:
             json = self.resolve_path(json)
             _LOG.info("Load config file: %s", json)
-            with open(json, encoding="utf-8") as fh_json:
-                config = json5.load(fh_json)
+            # Make a copy since the callers (and the code below) modify the config.
+            config = copy.deepcopy(
+                _load_config_file(os.path.realpath(json), os.stat(json).st_mtime_ns)
+            )
         if schema_type is not None:
             try:
                 schema_type.validate(config)
@@ -11,6 +11,7 @@ import shlex
 import subprocess
 import sys
 from collections.abc import Callable, Iterable, Mapping
+from functools import lru_cache
 from string import Template
 from typing import TYPE_CHECKING, Any
 
@@ -24,6 +25,9 @@ if TYPE_CHECKING:
 
 _LOG = logging.getLogger(__name__)
 
+_SHELL_SPECIAL_CHARS = frozenset("$`*?[]{}~!#\\'\"();&|<> \t\n")
+"""Characters that make a (split) command line token need a shell to interpret it."""
+
 
 def split_cmdline(cmdline: str) -> Iterable[list[str]]:
     """
@@ -60,6 +64,18 @@ def split_cmdline(cmdline: str) -> Iterable[list[str]]:
         yield subcmd
 
 
+@lru_cache(maxsize=1024)
+def _split_cmdline_cached(cmdline: str) -> tuple[tuple[str, ...], ...]:
+    """
+    Memoized version of :py:func:`split_cmdline`.
+
+    The same script lines get executed over and over again (e.g., on every trial),
+    so only tokenize each of them once. Returns immutable tuples so that the callers
+    cannot modify the cached values.
+    """
+    return tuple(tuple(subcmd) for subcmd in split_cmdline(cmdline))
+
+
 class LocalExecService(TempDirContextService, SupportsLocalExec):
     """
     Collection of methods to run scripts and commands in an external process on the node
@@ -197,11 +213,25 @@ class LocalExecService(TempDirContextService, SupportsLocalExec):
         """
         # Split the command line into set of subcmd tokens.
         # For each subcmd, perform path resolution fixups for any scripts being executed.
-        subcmds = split_cmdline(script_line)
-        subcmds = [self._resolve_cmdline_script_path(subcmd) for subcmd in subcmds]
+        # (Tokenizing is memoized, but the paths are resolved on every call
+        # since the scripts may come and go.)
+        subcmds = [
+            self._resolve_cmdline_script_path(list(subcmd))
+            for subcmd in _split_cmdline_cached(script_line)
+        ]
         # Finally recombine all of the fixed up subcmd tokens into the original.
         cmd = [token for subcmd in subcmds for token in subcmd]
 
+        # A lone python script invocation with plain arguments does not need a
+        # shell, so we can save an extra fork+exec of /bin/sh for it.
+        use_shell = not (
+            sys.platform != "win32"
+            and len(subcmds) == 1
+            and len(cmd) > 1
+            and cmd[0] == sys.executable
+            and not any(_SHELL_SPECIAL_CHARS.intersection(token) for token in cmd[1:])
+        )
+
         env: dict[str, str] = {}
         if env_params:
             env = {key: str(val) for (key, val) in env_params.items()}
@@ -214,7 +244,7 @@ class LocalExecService(TempDirContextService, SupportsLocalExec):
             env = env_copy
 
         try:
-            if sys.platform != "win32":
+            if use_shell and sys.platform != "win32":
                 cmd = [" ".join(cmd)]
 
             _LOG.info("Run: %s", cmd)
@@ -226,7 +256,7 @@ class LocalExecService(TempDirContextService, SupportsLocalExec):
                 cmd,
                 env=env or None,
                 cwd=cwd,
-                shell=True,
+                shell=use_shell,
                 text=True,
                 check=False,
                 capture_output=True,
@@ -87,6 +87,8 @@ class AzureDeploymentService(Service, metaclass=abc.ABCMeta):
         self._backoff_factor = float(
             self.config.get("requestBackoffFactor", self._REQUEST_RETRY_BACKOFF_FACTOR)
         )
+        # Cache of HTTP sessions, keyed by the (total_retries, backoff_factor) policy.
+        self._sessions: dict[tuple[int, float], requests.Session] = {}
 
         self._deploy_template = {}
         self._deploy_params = {}
@@ -134,14 +136,21 @@ class AzureDeploymentService(Service, metaclass=abc.ABCMeta):
     def _get_session(self, params: dict) -> requests.Session:
         """Get a session object that includes automatic retries and headers for REST API
         calls.
+
+        Sessions are reused across calls with the same retry policy so that
+        status polling can keep the connections (and TLS handshakes) alive.
         """
         total_retries = params.get("requestTotalRetries", self._total_retries)
         backoff_factor = params.get("requestBackoffFactor", self._backoff_factor)
-        session = requests.Session()
-        session.mount(
-            "https://",
-            HTTPAdapter(max_retries=Retry(total=total_retries, backoff_factor=backoff_factor)),
-        )
+        session = self._sessions.get((total_retries, backoff_factor))
+        if session is None:
+            session = requests.Session()
+            session.mount(
+                "https://",
+                HTTPAdapter(max_retries=Retry(total=total_retries, backoff_factor=backoff_factor)),
+            )
+            self._sessions[(total_retries, backoff_factor)] = session
+        # Auth headers can change over time (e.g., token refresh), so always update them.
         session.headers.update(self._get_headers())
         return session
 
@@ -5,6 +5,7 @@
 """Alembic environment script."""
 # pylint: disable=no-member
 
+import re
 import sys
 from logging.config import fileConfig
 
@@ -27,6 +28,15 @@ if config.config_file_name is not None and "alembic" in sys.argv[0]:
 # for 'autogenerate' support
 target_metadata = DbSchema(engine=None).meta
 
+# Partitions of the trial_telemetry table (see DbSchema) are not in the metadata.
+_PARTITION_NAME_RE = re.compile(r"^trial_telemetry_p\d+$")
+
+
+def include_name(name: str | None, type_: str, _parent_names: dict) -> bool:
+    """Skip the DB objects that are not part of the metadata on autogenerate."""
+    return not (type_ == "table" and name and _PARTITION_NAME_RE.match(name))
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -47,6 +57,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -74,12 +85,22 @@ def run_migrations_online() -> None:
         )
 
         with connectable.connect() as connection:
-            context.configure(connection=connection, target_metadata=target_metadata)
+            context.configure(
+                connection=connection,
+                target_metadata=target_metadata,
+                include_name=include_name,
+                compare_type=True,
+            )
 
             with context.begin_transaction():
                 context.run_migrations()
     else:
-        context.configure(connection=connectable, target_metadata=target_metadata)
+        context.configure(
+            connection=connectable,
+            target_metadata=target_metadata,
+            include_name=include_name,
+            compare_type=True,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
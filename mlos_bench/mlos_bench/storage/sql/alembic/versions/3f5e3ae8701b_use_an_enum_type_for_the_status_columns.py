@@ -0,0 +1,81 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Use an enum type for the status columns
+
+Revision ID: 3f5e3ae8701b
+Revises: 422a29ddfdc5
+Create Date: 2026-10-15 03:32:13.305520+00:00
+
+"""
+# pylint: disable=no-member
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f5e3ae8701b"
+down_revision: str | None = "422a29ddfdc5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Snapshot of the `mlos_bench.environments.Status` enum names at this revision.
+_STATUS_ENUM = sa.Enum(
+    "UNKNOWN",
+    "PENDING",
+    "READY",
+    "RUNNING",
+    "SUCCEEDED",
+    "CANCELED",
+    "FAILED",
+    "TIMED_OUT",
+    name="status_enum",
+    length=16,
+)
+
+_STATUS_COLUMNS = [
+    ("experiment", True),
+    ("trial", False),
+    ("trial_status", False),
+]
+"""The (table name, nullable) of all status columns."""
+
+# Other dialects store the non-native enum as VARCHAR(16), same as before.
+_NATIVE_ENUM_DIALECTS = {"postgresql", "mysql", "mariadb"}
+
+
+def upgrade() -> None:
+    """The schema upgrade script for this revision."""
+    bind = op.get_bind()
+    if bind.dialect.name not in _NATIVE_ENUM_DIALECTS:
+        return
+    _STATUS_ENUM.create(bind, checkfirst=True)
+    for table_name, nullable in _STATUS_COLUMNS:
+        op.alter_column(
+            table_name,
+            "status",
+            existing_type=sa.String(length=16),
+            existing_nullable=nullable,
+            type_=_STATUS_ENUM,
+            postgresql_using="status::status_enum",
+        )
+
+
+def downgrade() -> None:
+    """The schema downgrade script for this revision."""
+    bind = op.get_bind()
+    if bind.dialect.name not in _NATIVE_ENUM_DIALECTS:
+        return
+    for table_name, nullable in _STATUS_COLUMNS:
+        op.alter_column(
+            table_name,
+            "status",
+            existing_type=_STATUS_ENUM,
+            existing_nullable=nullable,
+            type_=sa.String(length=16),
+            postgresql_using="status::text",
+        )
+    _STATUS_ENUM.drop(bind, checkfirst=True)
@@ -4,6 +4,9 @@
 #
 """Common SQL methods for accessing the stored benchmark data."""
 
+import math
+import numbers
+import re
 from collections.abc import Mapping
 from typing import Any
 
@@ -18,6 +21,38 @@ from mlos_bench.storage.base_trial_data import TrialData
 from mlos_bench.storage.sql.schema import DbSchema
 from mlos_bench.util import nullable, utcify_nullable_timestamp, utcify_timestamp
 
+_NUMERIC_RE = re.compile(r"[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?")
+"""Strict (plain decimal) notation of the numeric metric values (see
+`metric_value_num()`).
+"""
+
+
+def metric_value_num(value: Any) -> float | None:
+    """
+    Get the numeric representation of a metric value, if it has one.
+
+    It is stored alongside the string representation of the value so that
+    numeric metrics can be filtered and aggregated in SQL (e.g., with AVG/MIN/MAX)
+    without parsing strings.
+
+    Parameters
+    ----------
+    value : Any
+        The metric value to convert.
+
+    Returns
+    -------
+    value : float | None
+        The value as float or None if it is not a (finite) number or a string
+        in a plain decimal notation of one (e.g., not "True", " 1 ", "1_000", or "nan").
+    """
+    if isinstance(value, str):
+        return float(value) if _NUMERIC_RE.fullmatch(value) else None
+    if isinstance(value, numbers.Real) and not isinstance(value, bool):
+        num_value = float(value)
+        return num_value if math.isfinite(num_value) else None
+    return None
+
 
 def save_params(
     conn: Connection,
@@ -19,16 +19,19 @@ details on how to invoke only the schema creation/update routines.
 
 import logging
 from importlib.resources import files
-from typing import Any
+from io import StringIO
+from typing import TYPE_CHECKING, Any
 
-from alembic import command, config
 from sqlalchemy import (
+    DDL,
     Column,
     Connection,
     DateTime,
     Dialect,
+    Enum,
     Float,
     ForeignKeyConstraint,
+    Index,
     Integer,
     MetaData,
     PrimaryKeyConstraint,
@@ -37,14 +40,45 @@ from sqlalchemy import (
     Table,
     UniqueConstraint,
     create_mock_engine,
+    event,
     inspect,
+    text,
 )
 from sqlalchemy.engine import Engine
 
+from mlos_bench.environments.status import Status
 from mlos_bench.util import path_join
 
+if TYPE_CHECKING:
+    # Alembic is relatively heavy to import, so only load it when it's needed.
+    from alembic.config import Config
+
 _LOG = logging.getLogger(__name__)
 
+_ALEMBIC_INI_PATH = path_join(str(files("mlos_bench.storage.sql")), "alembic.ini", abs_path=True)
+"""Path to the alembic config file for the schema migrations."""
+
+
+_ALEMBIC_HEAD = "3f5e3ae8701b"
+"""
+Latest revision of the schema migrations.
+
+Hardcoded to check the DB schema version without loading alembic.
+Must be updated with each new revision in the alembic versions directory
+(a unit test checks that).
+"""
+
+
+def _get_current_revision(conn: Connection) -> str | None:
+    """Get the schema revision the DB is stamped with (if any) without loading
+    alembic.
+    """
+    if not inspect(conn).has_table("alembic_version"):
+        return None
+    revisions = conn.execute(text("SELECT version_num FROM alembic_version")).scalars().all()
+    # Multiple rows would mean multiple branches: leave those to alembic.
+    return revisions[0] if len(revisions) == 1 else None
+
 
 class _DDL:
     """
@@ -55,13 +89,15 @@ class _DDL:
 
     def __init__(self, dialect: Dialect):
         self._dialect = dialect
-        self.statements: list[str] = []
+        self._buf = StringIO()
 
     def __call__(self, sql: Any, *_args: Any, **_kwargs: Any) -> None:
-        self.statements.append(str(sql.compile(dialect=self._dialect)))
+        if self._buf.tell():
+            self._buf.write(";\n")
+        self._buf.write(str(sql.compile(dialect=self._dialect)))
 
     def __repr__(self) -> str:
-        res = ";\n".join(self.statements)
+        res = self._buf.getvalue()
         return res + ";" if res else ""
 
 
@@ -78,6 +114,18 @@ class DbSchema:
     _METRIC_VALUE_LEN = 255
     _STATUS_LEN = 16
 
+    _TELEMETRY_PARTITIONS = 8
+    """
+    Number of hash partitions (by `exp_id`) of the telemetry table in PostgreSQL.
+
+    NOTE: Partitioning only applies to the PostgreSQL databases created from
+    scratch. There is no migration for it, so the telemetry table of an existing
+    database stays as is (and works the same way, just without partition pruning).
+    """
+
+    _META_CACHE: dict[str, MetaData] = {}
+    """Cache of the table declarations (MetaData objects) per dialect flavor."""
+
     def __init__(self, engine: Engine | None):
         """
         Declare the SQLAlchemy schema for the database.
@@ -93,12 +141,104 @@ class DbSchema:
         """
         _LOG.info("Create the DB schema for: %s", engine)
         self._engine = engine
-        self._meta = MetaData()
+        # Cached output of `__repr__()` (the schema is fixed after construction).
+        self._ddl: str | None = None
+        # The tables are the same for all instances, so (re)use one MetaData per
+        # dialect flavor instead of re-declaring all of them every time.
+        dialect_name = engine.dialect.name if engine else "default"
+        if dialect_name not in ("duckdb", "postgresql"):
+            dialect_name = "default"
+        meta = self._META_CACHE.get(dialect_name)
+        if meta is None:
+            meta = self._META_CACHE.setdefault(dialect_name, self._build_meta(dialect_name))
+        self._meta = meta
+
+        self.experiment: Table = self._meta.tables["experiment"]
+        """The Table storing
+        :py:class:`~mlos_bench.storage.base_experiment_data.ExperimentData` info.
+        """
+
+        self.objectives: Table = self._meta.tables["objectives"]
+        """The Table storing
+        :py:class:`~mlos_bench.storage.base_storage.Storage.Experiment` optimization
+        objectives info.
+        """
+
+        self.config: Table = self._meta.tables["config"]
+        """The Table storing
+        :py:class:`~mlos_bench.storage.base_tunable_config_data.TunableConfigData`
+        info.
+        """
+
+        self.trial: Table = self._meta.tables["trial"]
+        """The Table storing :py:class:`~mlos_bench.storage.base_trial_data.TrialData`
+        info.
+        """
+
+        self.config_param: Table = self._meta.tables["config_param"]
+        """The Table storing
+        :py:class:`~mlos_bench.storage.base_tunable_config_data.TunableConfigData`
+        info.
+        """
+
+        self.trial_param: Table = self._meta.tables["trial_param"]
+        """The Table storing :py:class:`~mlos_bench.storage.base_trial_data.TrialData`
+        :py:attr:`metadata <mlos_bench.storage.base_trial_data.TrialData.metadata_dict>`
+        info.
+        """
+
+        self.trial_status: Table = self._meta.tables["trial_status"]
+        """The Table storing :py:class:`~mlos_bench.storage.base_trial_data.TrialData`
+        :py:class:`~mlos_bench.environments.status.Status` info.
+        """
+
+        self.trial_result: Table = self._meta.tables["trial_result"]
+        """The Table storing :py:class:`~mlos_bench.storage.base_trial_data.TrialData`
+        :py:attr:`results <mlos_bench.storage.base_trial_data.TrialData.results_dict>`
+        info.
+        """
+
+        self.trial_telemetry: Table = self._meta.tables["trial_telemetry"]
+        """The Table storing :py:class:`~mlos_bench.storage.base_trial_data.TrialData`
+        :py:attr:`telemetry <mlos_bench.storage.base_trial_data.TrialData.telemetry_df>`
+        info.
+        """
+
+        _LOG.debug("Schema: %s", self._meta)
+
+    @classmethod
+    def _build_meta(cls, dialect_name: str) -> MetaData:
+        """
+        Declare all DB tables in a new SQLAlchemy MetaData object.
+
+        Parameters
+        ----------
+        dialect_name : str
+            Name of the SQL dialect to build the schema for.
+            Only "duckdb" and "postgresql" need special handling,
+            everything else is "default".
+
+        Returns
+        -------
+        meta : sqlalchemy.MetaData
+            A new MetaData object with all the tables of the schema.
+        """
+        meta = MetaData()
+
+        # The text IDs of `mlos_bench.environments.Status` enum members.
+        # Stored as a native (compact) enum type in PostgreSQL and MySQL,
+        # and as VARCHAR elsewhere.
+        status_type = Enum(
+            *(status.name for status in Status),
+            name="status_enum",
+            length=cls._STATUS_LEN,
+            metadata=meta,
+        )
 
-        self.experiment = Table(
+        experiment = Table(
             "experiment",
-            self._meta,
-            Column("exp_id", String(self._ID_LEN), nullable=False),
+            meta,
+            Column("exp_id", String(cls._ID_LEN), nullable=False),
             Column("description", String(1024)),
             Column("root_env_config", String(1024), nullable=False),
             Column("git_repo", String(1024), nullable=False),
@@ -108,7 +248,7 @@ class DbSchema:
             Column("ts_end", DateTime),
             # Should match the text IDs of `mlos_bench.environments.Status` enum:
             # For backwards compatibility, we allow NULL for status.
-            Column("status", String(self._STATUS_LEN)),
+            Column("status", status_type),
             # There may be more than one mlos_benchd_service running on different hosts.
             # This column stores the host/container name of the driver that
             # picked up the experiment.
@@ -118,15 +258,12 @@ class DbSchema:
             Column("driver_pid", Integer, comment="Driver Process ID"),
             PrimaryKeyConstraint("exp_id"),
         )
-        """The Table storing
-        :py:class:`~mlos_bench.storage.base_experiment_data.ExperimentData` info.
-        """
 
-        self.objectives = Table(
+        Table(
             "objectives",
-            self._meta,
+            meta,
             Column("exp_id"),
-            Column("optimization_target", String(self._ID_LEN), nullable=False),
+            Column("optimization_target", String(cls._ID_LEN), nullable=False),
             Column("optimization_direction", String(4), nullable=False),
             # TODO: Note: weight is not fully supported yet as currently
             # multi-objective is expected to explore each objective equally.
@@ -134,15 +271,11 @@ class DbSchema:
             # eventually.
             Column("weight", Float, nullable=True),
             PrimaryKeyConstraint("exp_id", "optimization_target"),
-            ForeignKeyConstraint(["exp_id"], [self.experiment.c.exp_id]),
+            ForeignKeyConstraint(["exp_id"], [experiment.c.exp_id]),
         )
-        """The Table storing
-        :py:class:`~mlos_bench.storage.base_storage.Storage.Experiment` optimization
-        objectives info.
-        """
 
         # A workaround for SQLAlchemy issue with autoincrement in DuckDB:
-        if engine and engine.dialect.name == "duckdb":
+        if dialect_name == "duckdb":
             seq_config_id = Sequence("seq_config_id")
             col_config_id = Column(
                 "config_id",
@@ -161,127 +294,126 @@ class DbSchema:
                 autoincrement=True,
             )
 
-        self.config = Table(
+        config = Table(
             "config",
-            self._meta,
+            meta,
             col_config_id,
             Column("config_hash", String(64), nullable=False, unique=True),
         )
-        """The Table storing
-        :py:class:`~mlos_bench.storage.base_tunable_config_data.TunableConfigData`
-        info.
-        """
 
-        self.trial = Table(
+        trial = Table(
             "trial",
-            self._meta,
-            Column("exp_id", String(self._ID_LEN), nullable=False),
+            meta,
+            Column("exp_id", String(cls._ID_LEN), nullable=False),
             Column("trial_id", Integer, nullable=False),
             Column("config_id", Integer, nullable=False),
             Column("trial_runner_id", Integer, nullable=True, default=None),
             Column("ts_start", DateTime, nullable=False),
             Column("ts_end", DateTime),
             # Should match the text IDs of `mlos_bench.environments.Status` enum:
-            Column("status", String(self._STATUS_LEN), nullable=False),
+            Column("status", status_type, nullable=False),
             PrimaryKeyConstraint("exp_id", "trial_id"),
-            ForeignKeyConstraint(["exp_id"], [self.experiment.c.exp_id]),
-            ForeignKeyConstraint(["config_id"], [self.config.c.config_id]),
+            ForeignKeyConstraint(["exp_id"], [experiment.c.exp_id]),
+            ForeignKeyConstraint(["config_id"], [config.c.config_id]),
+            # For the scheduler polling for the pending trials of an experiment.
+            Index("ix_trial_exp_id_status", "exp_id", "status"),
+            # For grouping the trials of an experiment by their tunable config.
+            Index("ix_trial_exp_id_config_id", "exp_id", "config_id"),
         )
-        """The Table storing :py:class:`~mlos_bench.storage.base_trial_data.TrialData`
-        info.
-        """
 
         # Values of the tunable parameters of the experiment,
         # fixed for a particular trial config.
-        self.config_param = Table(
+        Table(
             "config_param",
-            self._meta,
+            meta,
             Column("config_id", Integer, nullable=False),
-            Column("param_id", String(self._ID_LEN), nullable=False),
-            Column("param_value", String(self._PARAM_VALUE_LEN)),
+            Column("param_id", String(cls._ID_LEN), nullable=False),
+            Column("param_value", String(cls._PARAM_VALUE_LEN)),
             PrimaryKeyConstraint("config_id", "param_id"),
-            ForeignKeyConstraint(["config_id"], [self.config.c.config_id]),
+            ForeignKeyConstraint(["config_id"], [config.c.config_id]),
         )
-        """The Table storing
-        :py:class:`~mlos_bench.storage.base_tunable_config_data.TunableConfigData`
-        info.
-        """
 
         # Values of additional non-tunable parameters of the trial,
         # e.g., scheduled execution time, VM name / location, number of repeats, etc.
-        self.trial_param = Table(
+        Table(
             "trial_param",
-            self._meta,
-            Column("exp_id", String(self._ID_LEN), nullable=False),
+            meta,
+            Column("exp_id", String(cls._ID_LEN), nullable=False),
             Column("trial_id", Integer, nullable=False),
-            Column("param_id", String(self._ID_LEN), nullable=False),
-            Column("param_value", String(self._PARAM_VALUE_LEN)),
+            Column("param_id", String(cls._ID_LEN), nullable=False),
+            Column("param_value", String(cls._PARAM_VALUE_LEN)),
             PrimaryKeyConstraint("exp_id", "trial_id", "param_id"),
             ForeignKeyConstraint(
                 ["exp_id", "trial_id"],
-                [self.trial.c.exp_id, self.trial.c.trial_id],
+                [trial.c.exp_id, trial.c.trial_id],
             ),
         )
-        """The Table storing :py:class:`~mlos_bench.storage.base_trial_data.TrialData`
-        :py:attr:`metadata <mlos_bench.storage.base_trial_data.TrialData.metadata_dict>`
-        info.
-        """
 
-        self.trial_status = Table(
+        Table(
             "trial_status",
-            self._meta,
-            Column("exp_id", String(self._ID_LEN), nullable=False),
+            meta,
+            Column("exp_id", String(cls._ID_LEN), nullable=False),
             Column("trial_id", Integer, nullable=False),
             Column("ts", DateTime(timezone=True), nullable=False, default="now"),
-            Column("status", String(self._STATUS_LEN), nullable=False),
+            Column("status", status_type, nullable=False),
             UniqueConstraint("exp_id", "trial_id", "ts"),
             ForeignKeyConstraint(
                 ["exp_id", "trial_id"],
-                [self.trial.c.exp_id, self.trial.c.trial_id],
+                [trial.c.exp_id, trial.c.trial_id],
             ),
         )
-        """The Table storing :py:class:`~mlos_bench.storage.base_trial_data.TrialData`
-        :py:class:`~mlos_bench.environments.status.Status` info.
-        """
 
-        self.trial_result = Table(
+        Table(
             "trial_result",
-            self._meta,
-            Column("exp_id", String(self._ID_LEN), nullable=False),
+            meta,
+            Column("exp_id", String(cls._ID_LEN), nullable=False),
             Column("trial_id", Integer, nullable=False),
-            Column("metric_id", String(self._ID_LEN), nullable=False),
-            Column("metric_value", String(self._METRIC_VALUE_LEN)),
+            Column("metric_id", String(cls._ID_LEN), nullable=False),
+            Column("metric_value", String(cls._METRIC_VALUE_LEN)),
+            Column("metric_value_num", Float, nullable=True),
             PrimaryKeyConstraint("exp_id", "trial_id", "metric_id"),
             ForeignKeyConstraint(
                 ["exp_id", "trial_id"],
-                [self.trial.c.exp_id, self.trial.c.trial_id],
+                [trial.c.exp_id, trial.c.trial_id],
             ),
         )
-        """The Table storing :py:class:`~mlos_bench.storage.base_trial_data.TrialData`
-        :py:attr:`results <mlos_bench.storage.base_trial_data.TrialData.results_dict>`
-        info.
-        """
 
-        self.trial_telemetry = Table(
+        # Telemetry is the largest table and is always queried by experiment,
+        # so let PostgreSQL prune the partitions of other experiments.
+        # (New databases only - see the _TELEMETRY_PARTITIONS docstring above).
+        # NOTE: DuckDB's DDL compiler is derived from the PostgreSQL one,
+        # so only add the partitioning clause for PostgreSQL itself.
+        telemetry_opts: dict[str, Any] = (
+            {"postgresql_partition_by": "HASH (exp_id)"} if dialect_name == "postgresql" else {}
+        )
+        trial_telemetry = Table(
             "trial_telemetry",
-            self._meta,
-            Column("exp_id", String(self._ID_LEN), nullable=False),
+            meta,
+            Column("exp_id", String(cls._ID_LEN), nullable=False),
             Column("trial_id", Integer, nullable=False),
             Column("ts", DateTime(timezone=True), nullable=False, default="now"),
-            Column("metric_id", String(self._ID_LEN), nullable=False),
-            Column("metric_value", String(self._METRIC_VALUE_LEN)),
+            Column("metric_id", String(cls._ID_LEN), nullable=False),
+            Column("metric_value", String(cls._METRIC_VALUE_LEN)),
+            Column("metric_value_num", Float, nullable=True),
             UniqueConstraint("exp_id", "trial_id", "ts", "metric_id"),
             ForeignKeyConstraint(
                 ["exp_id", "trial_id"],
-                [self.trial.c.exp_id, self.trial.c.trial_id],
+                [trial.c.exp_id, trial.c.trial_id],
             ),
+            **telemetry_opts,
         )
-        """The Table storing :py:class:`~mlos_bench.storage.base_trial_data.TrialData`
-        :py:attr:`telemetry <mlos_bench.storage.base_trial_data.TrialData.telemetry_df>`
-        info.
-        """
-
-        _LOG.debug("Schema: %s", self._meta)
+        if dialect_name == "postgresql":
+            for i in range(cls._TELEMETRY_PARTITIONS):
+                event.listen(
+                    trial_telemetry,
+                    "after_create",
+                    DDL(
+                        f"CREATE TABLE trial_telemetry_p{i} PARTITION OF trial_telemetry"
+                        f" FOR VALUES WITH (MODULUS {cls._TELEMETRY_PARTITIONS}, REMAINDER {i})"
+                    ),
+                )
+
+        return meta
 
     @property
     def meta(self) -> MetaData:
@@ -289,10 +421,11 @@ class DbSchema:
         return self._meta
 
     @staticmethod
-    def _get_alembic_cfg(conn: Connection) -> config.Config:
-        alembic_cfg = config.Config(
-            path_join(str(files("mlos_bench.storage.sql")), "alembic.ini", abs_path=True)
-        )
+    def _get_alembic_cfg(conn: Connection) -> "Config":
+        # pylint: disable=import-outside-toplevel
+        from alembic.config import Config
+
+        alembic_cfg = Config(_ALEMBIC_INI_PATH)
         alembic_cfg.attributes["connection"] = conn
         return alembic_cfg
 
@@ -300,8 +433,16 @@ class DbSchema:
         """Create the DB schema."""
         _LOG.info("Create the DB schema")
         assert self._engine
-        self._meta.create_all(self._engine)
+        # Create the tables and check/stamp the schema version in the same
+        # connection and transaction.
         with self._engine.begin() as conn:
+            # Skip the per-table existence checks (and the inspection below) if the
+            # schema has already been created and stamped with the latest revision.
+            current_rev = _get_current_revision(conn)
+            if current_rev == _ALEMBIC_HEAD:
+                _LOG.debug("DB schema already exists: %s", current_rev)
+                return self
+            self._meta.create_all(conn)
             # If the trial table has the trial_runner_id column but no
             # "alembic_version" table, then the schema is up to date as of initial
             # create and we should mark it as such to avoid trying to run the
@@ -315,6 +456,8 @@ class DbSchema:
                 for column in inspect(conn).get_columns(self.trial.name)
             ) and not inspect(conn).has_table("alembic_version"):
                 # Mark the schema as up to date.
+                from alembic import command  # pylint: disable=import-outside-toplevel
+
                 alembic_cfg = self._get_alembic_cfg(conn)
                 command.stamp(alembic_cfg, "heads")
                 # command.current(alembic_cfg)
@@ -331,8 +474,19 @@ class DbSchema:
         """
         assert self._engine
         with self._engine.connect() as conn:
-            alembic_cfg = self._get_alembic_cfg(conn)
-            command.upgrade(alembic_cfg, "head")
+            # Skip the (relatively expensive) migration machinery if the DB is
+            # already at the latest revision.
+            current_rev = _get_current_revision(conn)
+            # End the (read-only) transaction implicitly started by the query above,
+            # so that alembic runs (and commits) the upgrade in its own transaction.
+            conn.rollback()
+            if current_rev == _ALEMBIC_HEAD:
+                _LOG.debug("DB schema is up to date: %s", current_rev)
+            else:
+                from alembic import command  # pylint: disable=import-outside-toplevel
+
+                _LOG.info("Update the DB schema from %s to %s", current_rev, _ALEMBIC_HEAD)
+                command.upgrade(self._get_alembic_cfg(conn), "head")
         return self
 
     def __repr__(self) -> str:
@@ -341,16 +495,18 @@ class DbSchema:
         scratch in current SQL dialect.
 
         That is, return a collection of CREATE TABLE statements and such.
-        NOTE: this method is quite heavy! We use it only once at startup
-        to log the schema, and if the logging level is set to DEBUG.
+        NOTE: generating the statements is quite heavy, so we do it only once
+        and cache the result.
 
         Returns
         -------
         sql : str
             A multi-line string with SQL statements to create the DB schema from scratch.
         """
-        assert self._engine
-        ddl = _DDL(self._engine.dialect)
-        mock_engine = create_mock_engine(self._engine.url, executor=ddl)
-        self._meta.create_all(mock_engine, checkfirst=False)
-        return str(ddl)
+        if self._ddl is None:
+            assert self._engine
+            ddl = _DDL(self._engine.dialect)
+            mock_engine = create_mock_engine(self._engine.url, executor=ddl)
+            self._meta.create_all(mock_engine, checkfirst=False)
+            self._ddl = str(ddl)
+        return self._ddl
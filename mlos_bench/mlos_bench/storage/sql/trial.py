@@ -18,7 +18,7 @@ from sqlalchemy.exc import IntegrityError
 
 from mlos_bench.environments.status import Status
 from mlos_bench.storage.base_storage import Storage
-from mlos_bench.storage.sql.common import save_params
+from mlos_bench.storage.sql.common import metric_value_num, save_params
 from mlos_bench.storage.sql.schema import DbSchema
 from mlos_bench.tunables.tunable_groups import TunableGroups
 from mlos_bench.util import nullable, utcify_timestamp
@@ -144,18 +144,20 @@ class Trial(Storage.Trial):
                             f"({cur_status.rowcount} rows)"
                         )
                     if metrics:
+                        # Use the executemany path (with a cacheable statement)
+                        # instead of compiling a new multi-VALUES INSERT every time.
                         conn.execute(
-                            self._schema.trial_result.insert().values(
-                                [
-                                    {
-                                        "exp_id": self._experiment_id,
-                                        "trial_id": self._trial_id,
-                                        "metric_id": key,
-                                        "metric_value": nullable(str, val),
-                                    }
-                                    for (key, val) in metrics.items()
-                                ]
-                            )
+                            self._schema.trial_result.insert(),
+                            [
+                                {
+                                    "exp_id": self._experiment_id,
+                                    "trial_id": self._trial_id,
+                                    "metric_id": key,
+                                    "metric_value": nullable(str, val),
+                                    "metric_value_num": metric_value_num(val),
+                                }
+                                for (key, val) in metrics.items()
+                            ],
                         )
                 else:
                     # Update of the status and ts_start when starting the trial:
@@ -200,25 +202,36 @@ class Trial(Storage.Trial):
         timestamp = utcify_timestamp(timestamp, origin="local")
         metrics = [(utcify_timestamp(ts, origin="local"), key, val) for (ts, key, val) in metrics]
         # NOTE: Not every SQLAlchemy dialect supports `Insert.on_conflict_do_nothing()`
-        # and we need to keep `.update_telemetry()` idempotent; hence a loop instead of
-        # a bulk upsert.
+        # and we need to keep `.update_telemetry()` idempotent; hence we try to insert
+        # all records at once and fall back to a loop instead of a bulk upsert.
         # See Also: comments in <https://github.com/microsoft/MLOS/pull/466>
         with self._engine.begin() as conn:
             self._update_status(conn, status, timestamp)
-        for metric_ts, key, val in metrics:
+        if not metrics:
+            return
+        records = [
+            {
+                "exp_id": self._experiment_id,
+                "trial_id": self._trial_id,
+                "ts": metric_ts,
+                "metric_id": key,
+                "metric_value": nullable(str, val),
+                "metric_value_num": metric_value_num(val),
+            }
+            for (metric_ts, key, val) in metrics
+        ]
+        try:
+            with self._engine.begin() as conn:
+                conn.execute(self._schema.trial_telemetry.insert(), records)
+            return
+        except IntegrityError as ex:
+            _LOG.debug("Some telemetry records already exist, insert one by one: %s", ex)
+        for record in records:
             with self._engine.begin() as conn:
                 try:
-                    conn.execute(
-                        self._schema.trial_telemetry.insert().values(
-                            exp_id=self._experiment_id,
-                            trial_id=self._trial_id,
-                            ts=metric_ts,
-                            metric_id=key,
-                            metric_value=nullable(str, val),
-                        )
-                    )
+                    conn.execute(self._schema.trial_telemetry.insert(), record)
                 except IntegrityError as ex:
-                    _LOG.warning("Record already exists: %s :: %s", (metric_ts, key, val), ex)
+                    _LOG.warning("Record already exists: %s :: %s", record, ex)
 
     def _update_status(self, conn: Connection, status: Status, timestamp: datetime) -> None:
         """
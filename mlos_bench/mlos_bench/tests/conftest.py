@@ -24,22 +24,28 @@ from mlos_bench.tunables.tunable_groups import TunableGroups
 
 # Expose some of those as local names so they can be picked up as fixtures by pytest.
 tunable_groups_config = tunable_groups_fixtures.tunable_groups_config
+tunable_groups_template = tunable_groups_fixtures.tunable_groups_template
 tunable_groups = tunable_groups_fixtures.tunable_groups
 mixed_numerics_tunable_groups = tunable_groups_fixtures.mixed_numerics_tunable_groups
 covariant_group = tunable_groups_fixtures.covariant_group
 
 
+def _mock_env_config(seed: int, metrics: list[str]) -> dict:
+    """Config for the MockEnv fixtures below (a new one for each call)."""
+    return {
+        "tunable_params": ["provision", "boot", "kernel"],
+        "mock_env_seed": seed,
+        "mock_env_range": [60, 120],
+        "mock_env_metrics": metrics,
+    }
+
+
 @pytest.fixture
 def mock_env(tunable_groups: TunableGroups) -> MockEnv:
     """Test fixture for MockEnv."""
     return MockEnv(
         name="Test Env",
-        config={
-            "tunable_params": ["provision", "boot", "kernel"],
-            "mock_env_seed": SEED,
-            "mock_env_range": [60, 120],
-            "mock_env_metrics": ["score"],
-        },
+        config=_mock_env_config(seed=SEED, metrics=["score"]),
         tunables=tunable_groups,
     )
 
@@ -49,12 +55,7 @@ def mock_env_no_noise(tunable_groups: TunableGroups) -> MockEnv:
     """Test fixture for MockEnv."""
     return MockEnv(
         name="Test Env No Noise",
-        config={
-            "tunable_params": ["provision", "boot", "kernel"],
-            "mock_env_seed": -1,
-            "mock_env_range": [60, 120],
-            "mock_env_metrics": ["score", "other_score"],
-        },
+        config=_mock_env_config(seed=-1, metrics=["score", "other_score"]),
         tunables=tunable_groups,
     )
 
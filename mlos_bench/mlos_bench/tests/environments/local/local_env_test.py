@@ -101,3 +101,59 @@ def test_local_env_wide(tunable_groups: TunableGroups) -> None:
         },
         expected_telemetry=[],
     )
+
+
+def test_local_env_long_mixed_types(tunable_groups: TunableGroups) -> None:
+    """Produce benchmark data in long format with both numeric and string metrics."""
+    local_env = create_local_env(
+        tunable_groups,
+        {
+            "run": [
+                "echo 'metric,value' > output.csv",
+                "echo 'latency,10' >> output.csv",
+                "echo 'score,0.9' >> output.csv",
+                "echo 'workload,tpcc' >> output.csv",
+            ],
+            "read_results_file": "output.csv",
+        },
+    )
+
+    check_env_success(
+        local_env,
+        tunable_groups,
+        expected_results={
+            "latency": 10,
+            "score": 0.9,
+            "workload": "tpcc",
+        },
+        expected_telemetry=[],
+    )
+
+
+def test_local_env_long_numeric_strings(tunable_groups: TunableGroups) -> None:
+    """Convert long format metrics to numbers only if `pandas.to_numeric` can do
+    that.
+    """
+    local_env = create_local_env(
+        tunable_groups,
+        {
+            "run": [
+                "echo 'metric,value' > output.csv",
+                "echo 'latency,1e3' >> output.csv",
+                "echo 'throughput,1_000' >> output.csv",
+                "echo 'workload,tpcc' >> output.csv",
+            ],
+            "read_results_file": "output.csv",
+        },
+    )
+
+    check_env_success(
+        local_env,
+        tunable_groups,
+        expected_results={
+            "latency": 1000.0,
+            "throughput": "1_000",
+            "workload": "tpcc",
+        },
+        expected_telemetry=[],
+    )
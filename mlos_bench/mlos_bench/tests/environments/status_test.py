@@ -0,0 +1,57 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Unit tests for the Status enum."""
+import pytest
+
+from mlos_bench.environments.status import Status
+
+
+@pytest.mark.parametrize(
+    ("status", "is_good", "is_completed"),
+    [
+        (Status.UNKNOWN, False, False),
+        (Status.PENDING, True, False),
+        (Status.READY, True, False),
+        (Status.RUNNING, True, False),
+        (Status.SUCCEEDED, True, True),
+        (Status.CANCELED, False, True),
+        (Status.FAILED, False, True),
+        (Status.TIMED_OUT, False, True),
+    ],
+)
+def test_status_predicates(status: Status, is_good: bool, is_completed: bool) -> None:
+    """Check the is_good() and is_completed() predicates for all statuses."""
+    assert status.is_good() == is_good
+    assert status.is_completed() == is_completed
+
+
+def test_status_str() -> None:
+    """Make sure Status members still format as `Status.NAME` and roundtrip by name."""
+    assert str(Status.SUCCEEDED) == "Status.SUCCEEDED"
+    assert f"{Status.FAILED}" == "Status.FAILED"
+    assert Status[Status.TIMED_OUT.name] is Status.TIMED_OUT
+
+
+def test_status_int() -> None:
+    """Check that Status members compare, order, and hash as their int values."""
+    assert Status.SUCCEEDED == 4
+    assert Status(4) is Status.SUCCEEDED
+    assert Status.PENDING < Status.RUNNING < Status.SUCCEEDED
+    assert sorted([Status.FAILED, Status.UNKNOWN, Status.READY]) == [
+        Status.UNKNOWN,
+        Status.READY,
+        Status.FAILED,
+    ]
+    assert {4: "ok"}[Status.SUCCEEDED] == "ok"
+    assert Status.SUCCEEDED in {4}
+
+
+@pytest.mark.parametrize("status", list(Status))
+def test_status_truthy(status: Status) -> None:
+    """Make sure all Status members are truthy (like the regular Enum ones), even
+    Status.UNKNOWN == 0.
+    """
+    assert bool(status)
+    assert (status or Status.FAILED) is status
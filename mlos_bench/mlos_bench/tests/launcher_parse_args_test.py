@@ -307,5 +307,19 @@ def test_launcher_args_parse_3(config_paths: list[str]) -> None:
     assert launcher.scheduler.trial_config_repeat_count == 2
 
 
+def test_launcher_extra_args_parse() -> None:
+    """Check the parsing of the extra global key/value pairs from the command line."""
+    # pylint: disable=protected-access
+    assert Launcher._try_parse_extra_args(
+        ["--max-suggestions", "10", "--experiment_id=test-exp", "--ratio", "0.5"]
+    ) == {"max_suggestions": 10, "experiment_id": "test-exp", "ratio": 0.5}
+    with pytest.raises(ValueError, match="has no value: foo"):
+        Launcher._try_parse_extra_args(["--foo", "--bar", "1"])
+    with pytest.raises(ValueError, match="has no value: foo"):
+        Launcher._try_parse_extra_args(["--bar", "1", "--foo"])
+    with pytest.raises(ValueError, match="has no key: 1"):
+        Launcher._try_parse_extra_args(["1", "--bar"])
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-n0"])
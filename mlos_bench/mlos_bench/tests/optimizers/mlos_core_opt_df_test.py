@@ -4,10 +4,12 @@
 #
 """Unit tests for internal methods of the `MlosCoreOptimizer`."""
 
+from unittest.mock import patch
 
 import pandas
 import pytest
 
+from mlos_bench.environments.status import Status
 from mlos_bench.optimizers.mlos_core_optimizer import MlosCoreOptimizer
 from mlos_bench.tests import SEED
 from mlos_bench.tunables.tunable_groups import TunableGroups
@@ -90,8 +92,8 @@ def test_df_str(mlos_core_optimizer: MlosCoreOptimizer, mock_configs: list[dict]
     assert df_config_orig.equals(df_config_str)
 
 
-def test_adjust_signs_df(mlos_core_optimizer: MlosCoreOptimizer) -> None:
-    """Test `MlosCoreOptimizer._adjust_signs_df()` on different types of inputs."""
+def test_scores_to_df(mlos_core_optimizer: MlosCoreOptimizer) -> None:
+    """Test `MlosCoreOptimizer._scores_to_df()` on different types of inputs."""
     df_scores_input = pandas.DataFrame(
         {
             "latency": [88.88, 66.66, 99.99, None],
@@ -107,25 +109,23 @@ def test_adjust_signs_df(mlos_core_optimizer: MlosCoreOptimizer) -> None:
     )
 
     # Make sure we adjust the signs for minimization.
-    df_scores = mlos_core_optimizer._adjust_signs_df(df_scores_input)
+    df_scores = mlos_core_optimizer._scores_to_df(df_scores_input.to_dict("records"))
     assert df_scores.equals(df_scores_output)
 
     # Check that the same operation works for string inputs.
-    df_scores = mlos_core_optimizer._adjust_signs_df(df_scores_input.astype(str))
+    df_scores = mlos_core_optimizer._scores_to_df(df_scores_input.astype(str).to_dict("records"))
     assert df_scores.equals(df_scores_output)
 
 
-def test_adjust_signs_df_nan(mlos_core_optimizer: MlosCoreOptimizer) -> None:
-    """Test `MlosCoreOptimizer._adjust_signs_df()` handling None, NaN, and Inf
-    values.
-    """
-    df_scores = mlos_core_optimizer._adjust_signs_df(
+def test_scores_to_df_nan(mlos_core_optimizer: MlosCoreOptimizer) -> None:
+    """Test `MlosCoreOptimizer._scores_to_df()` handling None, NaN, and Inf values."""
+    df_scores = mlos_core_optimizer._scores_to_df(
         pandas.DataFrame(
             {
                 "latency": ["88.88", "NaN", "Inf", "-Inf", None],
                 "throughput": ["111", "NaN", "Inf", "-Inf", None],
             }
-        )
+        ).to_dict("records")
     )
 
     assert df_scores.equals(
@@ -138,24 +138,83 @@ def test_adjust_signs_df_nan(mlos_core_optimizer: MlosCoreOptimizer) -> None:
     )
 
 
-def test_adjust_signs_df_invalid(mlos_core_optimizer: MlosCoreOptimizer) -> None:
-    """Test `MlosCoreOptimizer._adjust_signs_df()` on invalid inputs."""
+def test_scores_to_df_missing(mlos_core_optimizer: MlosCoreOptimizer) -> None:
+    """Test `MlosCoreOptimizer._scores_to_df()` on missing scores and targets."""
+    df_scores = mlos_core_optimizer._scores_to_df(
+        [
+            {"latency": 88.88, "throughput": 111},
+            {"latency": 66.66},
+            {"throughput": 222, "other": 42},
+            None,
+        ]
+    )
+    assert df_scores.equals(
+        pandas.DataFrame(
+            {
+                "latency": [88.88, 66.66, float("NaN"), float("NaN")],
+                "throughput": [-111, float("NaN"), -222, float("NaN")],
+            }
+        )
+    )
+
+
+def test_scores_to_df_invalid(mlos_core_optimizer: MlosCoreOptimizer) -> None:
+    """Test `MlosCoreOptimizer._scores_to_df()` on invalid inputs."""
     with pytest.raises(ValueError):
-        mlos_core_optimizer._adjust_signs_df(
-            pandas.DataFrame(
-                {
-                    "latency": ["INVALID"],
-                    "throughput": ["no input"],
-                }
-            )
+        mlos_core_optimizer._scores_to_df(
+            [
+                {"latency": "INVALID", "throughput": "no input"},
+            ]
         )
 
     with pytest.raises(ValueError):
-        mlos_core_optimizer._adjust_signs_df(
-            pandas.DataFrame(
-                {
-                    "latency": ["88.88", ""],
-                    "throughput": ["111", ""],
-                }
-            )
+        mlos_core_optimizer._scores_to_df(
+            [
+                {"latency": "88.88", "throughput": "111"},
+                {"latency": "", "throughput": ""},
+            ]
         )
+
+
+def test_register_pending(mlos_core_optimizer: MlosCoreOptimizer) -> None:
+    """Test that the observations buffered by `MlosCoreOptimizer.register()` get
+    passed to the underlying optimizer, and that bad ones fail only once.
+    """
+    score = {"latency": 88.88, "throughput": 111}
+    tunables = mlos_core_optimizer.suggest()
+    mlos_core_optimizer.register(tunables, Status.SUCCEEDED, score)
+    assert len(mlos_core_optimizer._pending_configs) == 1
+
+    # Invalid configs are rejected right away and are not buffered.
+    bad_tunables = TunableGroups(
+        {
+            "provision": {
+                "cost": 1000,
+                "params": {
+                    "vmSize": {
+                        "type": "categorical",
+                        "default": "Standard_D2s",
+                        "values": ["Standard_D2s"],
+                    },
+                },
+            },
+        }
+    )
+    with pytest.raises(ValueError):
+        mlos_core_optimizer.register(bad_tunables, Status.SUCCEEDED, score)
+    assert len(mlos_core_optimizer._pending_configs) == 1
+
+    # Buffered observations are registered on the next call that needs them.
+    (best_score, _best_tunables) = mlos_core_optimizer.get_best_observation()
+    assert best_score == score
+    assert not mlos_core_optimizer._pending_configs
+
+    # A failure to register the buffered observations is raised once.
+    tunables = mlos_core_optimizer.suggest()
+    mlos_core_optimizer.register(tunables, Status.FAILED)
+    with patch.object(mlos_core_optimizer._opt, "register", side_effect=RuntimeError):
+        with pytest.raises(RuntimeError):
+            mlos_core_optimizer.suggest()
+    assert not mlos_core_optimizer._pending_configs
+    assert not mlos_core_optimizer._pending_scores
+    mlos_core_optimizer.suggest()
@@ -11,6 +11,8 @@ from mlos_bench.environments.status import Status
 from mlos_bench.optimizers.base_optimizer import Optimizer
 from mlos_bench.optimizers.mlos_core_optimizer import MlosCoreOptimizer
 from mlos_bench.optimizers.mock_optimizer import MockOptimizer
+from mlos_bench.tests import SEED
+from mlos_bench.tunables.tunable_groups import TunableGroups
 from mlos_bench.tunables.tunable_types import TunableValue
 
 # pylint: disable=redefined-outer-name
@@ -158,3 +160,43 @@ def test_update_smac_max(
 ) -> None:
     """Test the bulk update of the SMAC optimizer."""
     _test_opt_update_max(smac_opt_max, mock_configs, mock_scores, mock_status)
+
+
+def test_update_flaml_str_scores(
+    flaml_opt: MlosCoreOptimizer,
+    mock_configs: list[dict],
+    mock_scores: list[dict[str, TunableValue] | None],
+    mock_status: list[Status],
+) -> None:
+    """Test the bulk update of the FLAML optimizer with string scores."""
+    scores_str: list[dict[str, TunableValue] | None] = [
+        None if score is None else {key: str(val) for (key, val) in score.items()}
+        for score in mock_scores
+    ]
+    _test_opt_update_min(flaml_opt, mock_configs, scores_str, mock_status)
+
+
+def test_update_flaml_missing_targets(
+    tunable_groups: TunableGroups,
+    mock_configs: list[dict],
+) -> None:
+    """Test the bulk update of a multi-target optimizer when some of the scores are
+    missing some of the optimization targets.
+    """
+    opt = MlosCoreOptimizer(
+        tunables=tunable_groups,
+        service=None,
+        config={
+            "optimization_targets": {"score": "min", "other": "max"},
+            "optimizer_type": "FLAML",
+            "max_suggestions": 10,
+            "seed": SEED,
+        },
+    )
+    opt.bulk_register(
+        mock_configs[:2],
+        [{"score": 1.0, "other": 2.0}, {"score": 2.0}],
+        [Status.SUCCEEDED, Status.SUCCEEDED],
+    )
+    (score, _tunables) = opt.get_best_observation()
+    assert score == {"score": 1.0, "other": 2.0}
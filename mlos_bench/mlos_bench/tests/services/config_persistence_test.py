@@ -5,6 +5,7 @@
 """Unit tests for configuration persistence service."""
 
 import os
+import tempfile
 from importlib.resources import files
 
 import pytest
@@ -86,6 +87,28 @@ def test_resolve_path_fail(config_persistence_service: ConfigPersistenceService)
     assert path == file_path
 
 
+def test_resolve_path_cached() -> None:
+    """Check that the cached path lookups do not go stale when the files move."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        service = ConfigPersistenceService({"config_path": [temp_dir]})
+        file_path = "foo-resolve-cached.txt"
+        full_path = path_join(temp_dir, file_path, abs_path=True)
+        # Not there yet: not resolved (and the miss is not remembered).
+        assert service.resolve_path(file_path) == file_path
+        with open(full_path, "w", encoding="utf-8") as fh_file:
+            fh_file.write("foo")
+        assert service.resolve_path(file_path) == full_path
+        assert service.resolve_path(file_path) == full_path
+        # Files in the extra paths take precedence over the cached lookups.
+        with tempfile.TemporaryDirectory() as extra_dir:
+            extra_path = path_join(extra_dir, file_path, abs_path=True)
+            with open(extra_path, "w", encoding="utf-8") as fh_file:
+                fh_file.write("bar")
+            assert service.resolve_path(file_path, extra_paths=[extra_dir]) == extra_path
+        os.remove(full_path)
+        assert service.resolve_path(file_path) == file_path
+
+
 def test_load_config(config_persistence_service: ConfigPersistenceService) -> None:
     """Check if we can successfully load a config file located relative to
     `config_path`.
@@ -99,6 +122,28 @@ def test_load_config(config_persistence_service: ConfigPersistenceService) -> No
     assert len(tunables_data) >= 1
 
 
+def test_load_config_cached(config_persistence_service: ConfigPersistenceService) -> None:
+    """Check that repeated loads of the same file return independent copies and pick
+    up the changes to the file.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_file = path_join(temp_dir, "tunable-values.jsonc")
+        with open(config_file, "w", encoding="utf-8") as fh_config:
+            fh_config.write('{"a": 1} // comment')
+        config = config_persistence_service.load_config(config_file, ConfigSchema.TUNABLE_VALUES)
+        config["a"] = 10
+        config = config_persistence_service.load_config(config_file, ConfigSchema.TUNABLE_VALUES)
+        assert config == {"a": 1}
+
+        with open(config_file, "w", encoding="utf-8") as fh_config:
+            fh_config.write('{"a": 2}')
+        # Make sure the mtime changes even on filesystems with coarse timestamps.
+        stat = os.stat(config_file)
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        config = config_persistence_service.load_config(config_file, ConfigSchema.TUNABLE_VALUES)
+        assert config == {"a": 2}
+
+
 def test_load_bad_config_path(config_persistence_service: ConfigPersistenceService) -> None:
     """Check if we can successfully load a config file located relative to
     `config_path`.
@@ -68,3 +68,33 @@ def test_run_python_script(local_exec_service: LocalExecService) -> None:
                 'echo "40000" > /proc/sys/kernel/sched_migration_cost_ns',
                 'echo "800000" > /proc/sys/kernel/sched_granularity_ns',
             ]
+
+
+@pytest.mark.parametrize(
+    ("args", "expected_stdout"),
+    [
+        ("foo bar", "['foo', 'bar']"),  # Runs without the shell.
+        ("$TEST_VAR bar", "['42', 'bar']"),  # Needs the shell to expand the variable.
+        ("foo > out.txt && cat out.txt", "['foo']"),  # Needs the shell for redirects.
+    ],
+)
+def test_run_python_script_args(
+    local_exec_service: LocalExecService,
+    args: str,
+    expected_stdout: str,
+) -> None:
+    """Make sure the arguments get passed to a Python script with or without the shell."""
+    with local_exec_service.temp_dir_context() as temp_dir:
+        script_path = path_join(temp_dir, "print_args.py")
+        with open(script_path, "w", encoding="utf-8") as fh_script:
+            fh_script.write("import sys\nprint(sys.argv[1:])\n")
+
+        (return_code, stdout, stderr) = local_exec_service.local_exec(
+            [f"{script_path} {args}"],
+            cwd=temp_dir,
+            env={"TEST_VAR": 42},
+        )
+
+        assert stderr.strip() == ""
+        assert return_code == 0
+        assert stdout.strip() == expected_stdout
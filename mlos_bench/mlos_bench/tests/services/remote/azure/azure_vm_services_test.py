@@ -209,6 +209,30 @@ def test_wait_vm_operation_ready(
     assert status.is_succeeded()
 
 
+@patch("mlos_bench.services.remote.azure.azure_deployment_services.time.sleep")
+@patch("mlos_bench.services.remote.azure.azure_deployment_services.requests.Session")
+def test_wait_vm_operation_reuse_session(
+    mock_session: MagicMock,
+    mock_sleep: MagicMock,  # pylint: disable=unused-argument
+    azure_vm_service: AzureVMService,
+) -> None:
+    """Check that polling the operation status reuses the same HTTP session."""
+    params = {"asyncResultsUrl": "DUMMY_ASYNC_URL", "vmName": "test-vm", "pollInterval": 1}
+
+    mock_status_response = MagicMock(status_code=200)
+    mock_status_response.json.side_effect = [
+        {"status": "InProgress"},
+        {"status": "InProgress"},
+        {"status": "Succeeded"},
+    ]
+    mock_session.return_value.get.return_value = mock_status_response
+
+    (status, _) = azure_vm_service.wait_host_operation(params)
+    assert status.is_succeeded()
+    assert mock_session.return_value.get.call_count == 3
+    assert mock_session.call_count == 1
+
+
 @patch("mlos_bench.services.remote.azure.azure_deployment_services.requests.Session")
 def test_wait_vm_operation_timeout(
     mock_session: MagicMock,
@@ -4,15 +4,31 @@
 #
 """Test sql schemas for mlos_bench storage."""
 
+from datetime import datetime
+from typing import Any
+
+from alembic import command
+from alembic.config import Config
 from alembic.migration import MigrationContext
-from sqlalchemy import inspect
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, create_mock_engine, event, inspect
+from sqlalchemy.dialects import postgresql
 
+from mlos_bench.environments.status import Status
+from mlos_bench.storage.base_experiment_data import ExperimentData
+from mlos_bench.storage.sql.schema import (
+    _ALEMBIC_HEAD,
+    _ALEMBIC_INI_PATH,
+    _DDL,
+    DbSchema,
+)
 from mlos_bench.storage.sql.storage import SqlStorage
+from mlos_bench.tunables.tunable_groups import TunableGroups
 
 # NOTE: This value is hardcoded to the latest revision in the alembic versions directory.
 # It could also be obtained programmatically using the "alembic heads" command or heads() API.
 # See Also: schema.py for an example of programmatic alembic config access.
-CURRENT_ALEMBIC_HEAD = "8928a401115b"
+CURRENT_ALEMBIC_HEAD = "3f5e3ae8701b"
 
 
 def test_storage_schemas(storage: SqlStorage) -> None:
@@ -32,3 +48,171 @@ def test_storage_schemas(storage: SqlStorage) -> None:
         assert (
             current_rev == CURRENT_ALEMBIC_HEAD
         ), f"Expected {CURRENT_ALEMBIC_HEAD}, got {current_rev}"
+
+
+def test_storage_schema_alembic_head() -> None:
+    """Check that the hardcoded schema head revision matches the alembic scripts."""
+    head = ScriptDirectory.from_config(Config(_ALEMBIC_INI_PATH)).get_current_head()
+    assert _ALEMBIC_HEAD == head == CURRENT_ALEMBIC_HEAD
+
+
+def test_storage_schema_ddl(storage: SqlStorage) -> None:
+    """Test that the DDL statements of the schema are generated (once)."""
+    db_schema = storage._db_schema  # pylint: disable=protected-access
+    ddl = repr(db_schema)
+    assert "CREATE TABLE experiment" in ddl
+    assert "CREATE TABLE trial_telemetry" in ddl
+    assert repr(db_schema) is ddl
+    assert "PARTITION" not in ddl
+
+
+def test_storage_schema_ddl_postgresql() -> None:
+    """Check that the telemetry table is hash-partitioned in (new) PostgreSQL DBs."""
+    # pylint: disable=protected-access
+    ddl = _DDL(postgresql.dialect())
+    # Compile the DDL without connecting to (or having a driver for) PostgreSQL.
+    mock_engine = create_mock_engine("postgresql://", executor=ddl)
+    db_schema = DbSchema(mock_engine)  # type: ignore[arg-type]
+    db_schema.meta.create_all(mock_engine, checkfirst=False)
+    ddl_str = repr(ddl)
+    assert "CREATE TABLE trial_telemetry (" in ddl_str
+    assert "PARTITION BY HASH (exp_id)" in ddl_str
+    for i in range(DbSchema._TELEMETRY_PARTITIONS):
+        assert (
+            f"CREATE TABLE trial_telemetry_p{i} PARTITION OF trial_telemetry"
+            f" FOR VALUES WITH (MODULUS {DbSchema._TELEMETRY_PARTITIONS}, REMAINDER {i})"
+        ) in ddl_str
+    # Only the telemetry table is partitioned.
+    assert ddl_str.count("PARTITION BY") == 1
+
+
+def test_storage_schema_ddl_duckdb() -> None:
+    """Check that the DuckDB DDL (compiled by a PostgreSQL-derived compiler) does not
+    get the PostgreSQL-only partitioning of the telemetry table.
+    """
+    ddl = repr(DbSchema(create_engine("duckdb://")))
+    assert "CREATE TABLE trial_telemetry" in ddl
+    assert "PARTITION" not in ddl
+
+
+def test_storage_schema_create_existing(storage: SqlStorage) -> None:
+    """Test that re-creating an up to date schema does not (re)check every table."""
+    # pylint: disable=protected-access
+    statements: list[str] = []
+
+    def _log_statement(*args: Any) -> None:
+        statements.append(args[2])  # (conn, cursor, statement, ...)
+
+    event.listen(storage._engine, "before_cursor_execute", _log_statement)
+    try:
+        storage._db_schema.create()
+    finally:
+        event.remove(storage._engine, "before_cursor_execute", _log_statement)
+    assert statements
+    assert len(statements) <= 2
+    assert not any("CREATE" in stmt for stmt in statements)
+
+
+def test_storage_schema_update(storage: SqlStorage) -> None:
+    """Test that the schema upgrade gets applied (and committed)."""
+    # pylint: disable=protected-access
+    eng = storage._engine
+    with eng.connect() as conn:
+        alembic_cfg = DbSchema._get_alembic_cfg(conn)
+        command.downgrade(alembic_cfg, "-1")
+    with eng.connect() as conn:
+        assert MigrationContext.configure(conn).get_current_revision() != CURRENT_ALEMBIC_HEAD
+    storage._db_schema.update()
+    with eng.connect() as conn:
+        assert MigrationContext.configure(conn).get_current_revision() == CURRENT_ALEMBIC_HEAD
+
+
+def test_storage_metric_value_num(
+    storage: SqlStorage,
+    exp_storage: SqlStorage.Experiment,
+    tunable_groups: TunableGroups,
+) -> None:
+    """Check that numeric metric values are also stored in the typed column."""
+    trial = exp_storage.new_trial(tunable_groups)
+    trial.update(
+        Status.SUCCEEDED,
+        datetime.now(),
+        {"score": 99.9, "benchmark": "test", "flag": True, "padded": " 1 "},
+    )
+    # pylint: disable=protected-access
+    trial_result = storage._db_schema.trial_result
+    with storage._engine.connect() as conn:
+        rows = conn.execute(
+            trial_result.select()
+            .with_only_columns(
+                trial_result.c.metric_id,
+                trial_result.c.metric_value,
+                trial_result.c.metric_value_num,
+            )
+            .where(trial_result.c.trial_id == trial.trial_id)
+            .order_by(trial_result.c.metric_id)
+        ).fetchall()
+    assert [tuple(row) for row in rows] == [
+        ("benchmark", "test", None),
+        ("flag", "True", None),
+        ("padded", " 1 ", None),
+        ("score", "99.9", 99.9),
+    ]
+
+
+def test_storage_metric_value_dtypes(
+    storage: SqlStorage,
+    exp_storage: SqlStorage.Experiment,
+    tunable_groups: TunableGroups,
+) -> None:
+    """Check that the typed metric values do not change the results_df dtypes."""
+    trial = exp_storage.new_trial(tunable_groups)
+    trial.update(Status.SUCCEEDED, datetime.now(), {"score": 99.9, "count": 10})
+    results_df = storage.experiments[exp_storage.experiment_id].results_df
+    assert results_df[ExperimentData.RESULT_COLUMN_PREFIX + "count"].dtype == "int64"
+    assert results_df[ExperimentData.RESULT_COLUMN_PREFIX + "score"].dtype == "float64"
+
+
+def test_storage_metric_value_num_backfill(
+    storage: SqlStorage,
+    exp_storage: SqlStorage.Experiment,
+    tunable_groups: TunableGroups,
+) -> None:
+    """Check that the schema upgrade backfills the numeric metric values."""
+    # pylint: disable=protected-access
+    trial = exp_storage.new_trial(tunable_groups)
+    trial.update(
+        Status.SUCCEEDED,
+        datetime.now(),
+        {
+            "score": 99.9,
+            "exp": "-1e3",
+            "benchmark": "test",
+            "flag": True,
+            "padded": " 1 ",
+            "underscore": "1_000",
+            "nan": "nan",
+        },
+    )
+    eng = storage._engine
+    with eng.begin() as conn:
+        # Roll back to the revision right before the metric_value_num columns.
+        command.downgrade(DbSchema._get_alembic_cfg(conn), "c4b2455edbbc")
+    storage._db_schema.update()
+
+    trial_result = storage._db_schema.trial_result
+    with eng.connect() as conn:
+        rows = conn.execute(
+            trial_result.select()
+            .with_only_columns(trial_result.c.metric_id, trial_result.c.metric_value_num)
+            .where(trial_result.c.trial_id == trial.trial_id)
+        ).fetchall()
+    assert dict(tuple(row) for row in rows) == {
+        "score": 99.9,
+        "exp": -1000.0,
+        "benchmark": None,
+        "flag": None,
+        "padded": None,
+        "underscore": None,
+        "nan": None,
+    }
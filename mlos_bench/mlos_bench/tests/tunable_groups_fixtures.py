@@ -71,17 +71,34 @@ TUNABLE_GROUPS_JSON = """
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tunable_groups_config() -> dict[str, Any]:
-    """Fixture to get the JSON string for the tunable groups."""
+    """
+    Fixture to get the (parsed and validated) config of the tunable groups.
+
+    NOTE: The config is shared by the whole session, so tests must not modify it.
+    """
     conf = json.loads(TUNABLE_GROUPS_JSON)
     assert isinstance(conf, dict)
     ConfigSchema.TUNABLE_PARAMS.validate(conf)
     return conf
 
 
+@pytest.fixture(scope="session")
+def tunable_groups_template(tunable_groups_config: dict[str, Any]) -> TunableGroups:
+    """
+    A session-wide mock TunableGroups to make copies from.
+
+    Parsing and validating the config is relatively slow, so do it only once.
+    Tests should use the `tunable_groups` fixture instead.
+    """
+    tunables = TunableGroups(tunable_groups_config)
+    tunables.reset()
+    return tunables
+
+
 @pytest.fixture
-def tunable_groups(tunable_groups_config: dict) -> TunableGroups:
+def tunable_groups(tunable_groups_template: TunableGroups) -> TunableGroups:
     """
     A test fixture that produces a mock TunableGroups.
 
@@ -90,9 +107,7 @@ def tunable_groups(tunable_groups_config: dict) -> TunableGroups:
     tunable_groups : TunableGroups
         A new TunableGroups object for testing.
     """
-    tunables = TunableGroups(tunable_groups_config)
-    tunables.reset()
-    return tunables
+    return tunable_groups_template.copy()
 
 
 @pytest.fixture
@@ -37,3 +37,12 @@ def test_covariant_group_tunables(covariant_group: CovariantTunableGroup) -> Non
     """Tests that we can access the tunables in the covariant group."""
     for tunable in covariant_group.get_tunables():
         assert isinstance(tunable, Tunable)
+
+
+def test_covariant_group_values_dict(covariant_group: CovariantTunableGroup) -> None:
+    """Tests that the covariant group values can be copied into an existing dict."""
+    values = covariant_group.get_tunable_values_dict()
+    assert values == {tunable.name: tunable.value for tunable in covariant_group.get_tunables()}
+    into_params = {"other": 42}
+    assert covariant_group.get_tunable_values_dict(into_params) is into_params
+    assert into_params == {"other": 42, **values}
@@ -51,3 +51,16 @@ def test_tunable_group_update_boot(tunable_groups: TunableGroups) -> None:
     assert tunable_groups.is_updated()
     assert tunable_groups.is_updated(["boot"])
     assert not tunable_groups.is_updated(["kernel"])
+
+
+def test_covariant_group_update(tunable_groups: TunableGroups) -> None:
+    """Test that updating a tunable via its covariant group returns whether the value
+    changed and sets the is_updated flag of the group.
+    """
+    (_, group) = tunable_groups.get_tunable("kernel_sched_latency_ns")
+    group.reset_is_updated()
+    assert not group.update("kernel_sched_latency_ns", group["kernel_sched_latency_ns"])
+    assert not group.is_updated()
+    assert group.update("kernel_sched_latency_ns", 9999)
+    assert group.is_updated()
+    assert tunable_groups["kernel_sched_latency_ns"] == 9999
@@ -2,7 +2,7 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 #
-"""Unit tests for deep copy of tunable objects and groups."""
+"""Unit tests for copying tunable objects and groups."""
 
 from mlos_bench.tunables.covariant_group import CovariantTunableGroup
 from mlos_bench.tunables.tunable import Tunable
@@ -44,3 +44,41 @@ def test_copy_covariant_group(covariant_group: CovariantTunableGroup) -> None:
     assert covariant_group_copy.is_updated()
     assert not covariant_group.is_updated()
     assert covariant_group != covariant_group_copy
+
+
+def test_copy_tunable_containers() -> None:
+    """Check that mutating the containers of a copy does not affect the original."""
+    tunable = Tunable(
+        name="test_copy",
+        config={
+            "type": "int",
+            "range": [0, 100],
+            "default": 10,
+            "special": [-1],
+            "special_weights": [0.1],
+            "range_weight": 0.9,
+            "distribution": {"type": "normal", "params": {"mu": 50, "sigma": 10}},
+            "meta": {"scale": [1, 2]},
+        },
+    )
+    tunable_copy = tunable.copy()
+    assert tunable == tunable_copy
+    tunable_copy.special.append(-2)
+    assert tunable_copy.weights is not None
+    tunable_copy.weights.append(0.5)
+    tunable_copy.distribution_params["mu"] = 0
+    tunable_copy.meta["scale"].append(3)
+    tunable_copy.meta["unit"] = "ms"
+    assert tunable.special == [-1]
+    assert tunable.weights == [0.1]
+    assert tunable.distribution_params == {"mu": 50, "sigma": 10}
+    assert tunable.meta == {"scale": [1, 2]}
+
+
+def test_copy_tunable_categorical_values(tunable_categorical: Tunable) -> None:
+    """Check that mutating the categories of a copy does not affect the original."""
+    values = list(tunable_categorical.values or [])
+    tunable_copy = tunable_categorical.copy()
+    assert tunable_copy.values is not None
+    tunable_copy.values.append("new_value")
+    assert tunable_categorical.values == values
@@ -14,6 +14,7 @@ mlos_bench.tunables.tunable_groups : TunableGroups class definition.
 """
 
 import copy
+import sys
 from collections.abc import Iterable
 
 from mlos_bench.tunables.tunable import Tunable
@@ -44,10 +45,10 @@ class CovariantTunableGroup:
             (e.g., deserialized from JSON).
         """
         self._is_updated = True
-        self._name = name
+        self._name = sys.intern(name)
         self._cost = int(config.get("cost", 0))
         self._tunables: dict[str, Tunable] = {
-            name: Tunable(name, tunable_config)
+            sys.intern(name): Tunable(name, tunable_config)
             for (name, tunable_config) in config.get("params", {}).items()
         }
 
@@ -79,15 +80,17 @@ class CovariantTunableGroup:
 
     def copy(self) -> "CovariantTunableGroup":
         """
-        Deep copy of the CovariantTunableGroup object.
+        Copy of the CovariantTunableGroup object.
 
         Returns
         -------
         group : CovariantTunableGroup
             A new instance of the CovariantTunableGroup object
-            that is a deep copy of the original one.
+            that does not share any mutable state with the original one.
         """
-        return copy.deepcopy(self)
+        group = copy.copy(self)
+        group._tunables = {name: tunable.copy() for (name, tunable) in self._tunables.items()}
+        return group
 
     def __eq__(self, other: object) -> bool:
         """
@@ -193,15 +196,27 @@ class CovariantTunableGroup:
         """Get the names of all tunables in the group."""
         return self._tunables.keys()
 
-    def get_tunable_values_dict(self) -> dict[str, TunableValue]:
+    def get_tunable_values_dict(
+        self,
+        into_params: dict[str, TunableValue] | None = None,
+    ) -> dict[str, TunableValue]:
         """
         Get current values of all tunables in the group as a dict.
 
+        Parameters
+        ----------
+        into_params : dict
+            An optional dict to copy the parameters and their values into.
+
         Returns
         -------
         tunables : dict[str, TunableValue]
         """
-        return {name: tunable.value for (name, tunable) in self._tunables.items()}
+        if into_params is None:
+            into_params = {}
+        for name, tunable in self._tunables.items():
+            into_params[name] = tunable.value
+        return into_params
 
     def __repr__(self) -> str:
         """
@@ -260,3 +275,27 @@ class CovariantTunableGroup:
         )
         self._is_updated |= self.get_tunable(tunable).update(value)
         return value
+
+    def update(self, name: str, value: TunableValue) -> bool:
+        """
+        Assign the value to the tunable with the given name and update the group's
+        `is_updated` flag accordingly.
+
+        Same as `group[name] = value`, but without the type checks for the
+        (common) case of a plain name and value, e.g., in `TunableGroups.assign()`.
+
+        Parameters
+        ----------
+        name : str
+            Name of the tunable parameter.
+        value : int | float | str
+            Value to assign.
+
+        Returns
+        -------
+        is_updated : bool
+            True if the new value is different from the previous one, False otherwise.
+        """
+        is_updated = self._tunables[name].update(value)
+        self._is_updated |= is_updated
+        return is_updated
@@ -27,6 +27,7 @@ See Also
 
 import copy
 import logging
+import sys
 from collections.abc import Iterable
 from typing import Any
 
@@ -127,7 +128,8 @@ class Tunable:  # pylint: disable=too-many-instance-attributes,too-many-public-m
         t_config = tunable_dict_from_dict(config)
         if not isinstance(name, str) or "!" in name:  # TODO: Use a regex here and in JSON schema
             raise ValueError(f"Invalid name of the tunable: {name}")
-        self._name = name
+        # Tunable names are used as dict keys everywhere, so intern them for faster lookups.
+        self._name = sys.intern(name)
         self._type: TunableValueTypeName = t_config["type"]  # required
         if self._type not in TUNABLE_DTYPE:
             raise ValueError(f"Invalid parameter type: {self._type}")
@@ -309,14 +311,23 @@ class Tunable:  # pylint: disable=too-many-instance-attributes,too-many-public-m
 
     def copy(self) -> "Tunable":
         """
-        Deep copy of the Tunable object.
+        Copy of the Tunable object.
 
         Returns
         -------
         tunable : Tunable
-            A new Tunable object that is a deep copy of the original one.
+            A new Tunable object that does not share any mutable state
+            (e.g., the lists and dicts returned by its properties) with the original one.
         """
-        return copy.deepcopy(self)
+        # Copy the attributes structurally instead of the (much slower) generic deepcopy.
+        tunable = copy.copy(self)
+        if self._values is not None:
+            tunable._values = self._values.copy()
+        tunable._meta = copy.deepcopy(self._meta)
+        tunable._distribution_params = self._distribution_params.copy()
+        tunable._special = self._special.copy()
+        tunable._weights = self._weights.copy()
+        return tunable
 
     @property
     def description(self) -> str | None:
@@ -121,14 +121,33 @@ class TunableGroups:
         :py:mod:`mlos_bench.tunables` :
             For more information on tunable parameters and their configuration.
         """
-        if config is None:
+        if config:
+            # Skip the schema validation of the (common) empty config case.
+            ConfigSchema.TUNABLE_PARAMS.validate(config)
+        else:
             config = {}
-        ConfigSchema.TUNABLE_PARAMS.validate(config)
-        # Index (Tunable id -> CovariantTunableGroup)
-        self._index: dict[str, CovariantTunableGroup] = {}
-        self._tunable_groups: dict[str, CovariantTunableGroup] = {}
-        for name, group_config in config.items():
-            self._add_group(CovariantTunableGroup(name, group_config))
+        self._tunable_groups: dict[str, CovariantTunableGroup] = {
+            name: CovariantTunableGroup(name, group_config)
+            for (name, group_config) in config.items()
+        }
+        # Index (Tunable id -> CovariantTunableGroup), built in one pass.
+        index_items = [
+            (tunable_name, group)
+            for group in self._tunable_groups.values()
+            for tunable_name in group.get_names()
+        ]
+        self._index: dict[str, CovariantTunableGroup] = dict(index_items)
+        # Cached (group name, tunable) pairs in the `__repr__()` order.
+        # The order depends only on the structure (not on the tunable values),
+        # so it is only reset when a group is added.
+        self._repr_order: list[tuple[str, Tunable]] | None = None
+        if len(self._index) != len(index_items):
+            # Rebuild incrementally to report the duplicate tunable.
+            groups = list(self._tunable_groups.values())
+            self._index = {}
+            self._tunable_groups = {}
+            for group in groups:
+                self._add_group(group)
 
     def __bool__(self) -> bool:
         return bool(self._index)
@@ -156,15 +175,24 @@ class TunableGroups:
 
     def copy(self) -> "TunableGroups":
         """
-        Deep copy of the TunableGroups object.
+        Copy of the TunableGroups object.
 
         Returns
         -------
         tunables : TunableGroups
             A new instance of the TunableGroups object
-            that is a deep copy of the original one.
+            that does not share any mutable state with the original one.
         """
-        return copy.deepcopy(self)
+        # Rebuild the structure directly instead of the (much slower) generic deepcopy.
+        tunables = copy.copy(self)
+        tunables._tunable_groups = {
+            name: group.copy() for (name, group) in self._tunable_groups.items()
+        }
+        tunables._index = {
+            name: tunables._tunable_groups[group.name] for (name, group) in self._index.items()
+        }
+        tunables._repr_order = None
+        return tunables
 
     def _add_group(self, group: CovariantTunableGroup) -> None:
         """
@@ -180,6 +208,7 @@ class TunableGroups:
             group.name not in self._tunable_groups
         ), f"Duplicate covariant tunable group name {group.name} in {self}"
         self._tunable_groups[group.name] = group
+        self._repr_order = None
         for tunable in group.get_tunables():
             if tunable.name in self._index:
                 raise ValueError(
@@ -210,18 +239,26 @@ class TunableGroups:
             Self-reference for chaining.
         """
         # pylint: disable=protected-access
-        # Check that covariant groups are unique, else throw an error.
-        for group in tunables._tunable_groups.values():
-            if group.name not in self._tunable_groups:
-                self._add_group(group)
-            else:
-                # Check that there's no overlap in the tunables.
-                # But allow for differing current values.
-                if not self._tunable_groups[group.name].equals_defaults(group):
-                    raise ValueError(
-                        f"Overlapping covariant tunable group name {group.name} "
-                        "in {self._tunable_groups[group.name]} and {tunables}"
-                    )
+        incoming = tunables._tunable_groups
+        # Check that covariant groups with the same names are the same, else throw
+        # an error (before modifying anything). But allow for differing current values.
+        common_names = incoming.keys() & self._tunable_groups.keys()
+        for name in common_names:
+            if not self._tunable_groups[name].equals_defaults(incoming[name]):
+                raise ValueError(
+                    f"Overlapping covariant tunable group name {name} "
+                    f"in {self._tunable_groups[name]} and {tunables}"
+                )
+        if not common_names and self._index.keys().isdisjoint(tunables._index.keys()):
+            # Fast path for the common case of disjoint collections (e.g., when
+            # composing the tunables of the environments): add all groups in bulk.
+            self._tunable_groups.update(incoming)
+            self._index.update(tunables._index)
+            self._repr_order = None
+        else:
+            for group in incoming.values():
+                if group.name not in common_names:
+                    self._add_group(group)
         return self
 
     def __repr__(self) -> str:
@@ -233,14 +270,14 @@ class TunableGroups:
         string : str
             A human-readable version of the TunableGroups.
         """
-        return (
-            "{ "
-            + ", ".join(
-                f"{group.name}::{tunable}"
+        if self._repr_order is None:
+            self._repr_order = [
+                (group.name, tunable)
                 for group in sorted(self._tunable_groups.values(), key=lambda g: (-g.cost, g.name))
-                for tunable in sorted(group._tunables.values())
-            )
-            + " }"
+                for tunable in sorted(group.get_tunables())
+            ]
+        return (
+            "{ " + ", ".join(f"{name}::{tunable}" for (name, tunable) in self._repr_order) + " }"
         )
 
     def __contains__(self, tunable: str | Tunable) -> bool:
@@ -259,14 +296,23 @@ class TunableGroups:
         tunable_value: TunableValue | Tunable,
     ) -> TunableValue:
         """Update the current value of a single tunable parameter."""
-        # Use double index to make sure we set the is_updated flag of the group
         name: str = tunable.name if isinstance(tunable, Tunable) else tunable
         value: TunableValue = (
             tunable_value.value if isinstance(tunable_value, Tunable) else tunable_value
         )
-        self._index[name][name] = value
+        self._set_by_name(name, value)
         return self._index[name][name]
 
+    def _set_by_name(self, name: str, value: TunableValue) -> None:
+        """
+        Update the current value of a single tunable parameter given its name.
+
+        Fast path of `__setitem__()` for callers that already have the name and the
+        plain value (e.g., `assign()`) and do not need the (coerced) value back.
+        """
+        # Update via the group to make sure we set the is_updated flag of the group
+        self._index[name].update(name, value)
+
     def __iter__(self) -> Generator[tuple[Tunable, CovariantTunableGroup]]:
         """
         An iterator over all tunables in the group.
@@ -277,7 +323,12 @@ class TunableGroups:
             An iterator over all tunables in all groups. Each element is a 2-tuple
             of an instance of the Tunable parameter and covariant group it belongs to.
         """
-        return ((group.get_tunable(name), group) for (name, group) in self._index.items())
+        # NOTE: The groups and their tunables are added to the index in the same order.
+        return (
+            (tunable, group)
+            for group in self._tunable_groups.values()
+            for tunable in group.get_tunables()
+        )
 
     def get_tunable(self, tunable: str | Tunable) -> tuple[Tunable, CovariantTunableGroup]:
         """
@@ -331,11 +382,16 @@ class TunableGroups:
             A collection of covariant tunable groups.
         """
         # pylint: disable=protected-access
-        tunables = TunableGroups()
+        groups: list[CovariantTunableGroup] = []
         for name in group_names:
             if name not in self._tunable_groups:
                 raise KeyError(f"Unknown covariant group name '{name}' in tunable group {self}")
-            tunables._add_group(self._tunable_groups[name])
+            groups.append(self._tunable_groups[name])
+        tunables = TunableGroups()
+        # The groups (and their tunables) in this collection are already known to be
+        # unique, so fill in the new one directly instead of via `_add_group()`.
+        tunables._tunable_groups = {group.name: group for group in groups}
+        tunables._index = {name: group for group in groups for name in group.get_names()}
         return tunables
 
     def get_param_values(
@@ -365,7 +421,7 @@ class TunableGroups:
         if into_params is None:
             into_params = {}
         for name in group_names:
-            into_params.update(self._tunable_groups[name].get_tunable_values_dict())
+            self._tunable_groups[name].get_tunable_values_dict(into_params)
         return into_params
 
     def is_updated(self, group_names: Iterable[str] | None = None) -> bool:
@@ -382,10 +438,9 @@ class TunableGroups:
         is_updated : bool
             True if any of the specified tunable groups has been updated, False otherwise.
         """
-        return any(
-            self._tunable_groups[name].is_updated()
-            for name in (group_names or self.get_covariant_group_names())
-        )
+        if not group_names:
+            return any(group.is_updated() for group in self._tunable_groups.values())
+        return any(self._tunable_groups[name].is_updated() for name in group_names)
 
     def is_defaults(self) -> bool:
         """
@@ -459,5 +514,5 @@ class TunableGroups:
             _LOG.info("Empty tunable values set provided. Resetting all tunables to defaults.")
             return self.restore_defaults()
         for key, value in param_values.items():
-            self[key] = value
+            self._set_by_name(key, value)
         return self
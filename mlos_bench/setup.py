@@ -69,11 +69,13 @@ extra_requires: dict[str, list[str]] = {  # pylint: disable=consider-using-named
     # Additional tools for extra functionality.
     "azure": ["azure-storage-file-share", "azure-identity", "azure-keyvault"],
     "ssh": ["asyncssh>=2.19.0"],
-    "storage-sql-duckdb": ["sqlalchemy", "alembic", "duckdb_engine"],
-    "storage-sql-mysql": ["sqlalchemy", "alembic", "mysql-connector-python"],
-    "storage-sql-postgres": ["sqlalchemy", "alembic", "psycopg2"],
+    "storage-sql-duckdb": ["sqlalchemy>=2.0", "alembic>=1.12", "duckdb_engine"],
+    "storage-sql-mysql": ["sqlalchemy>=2.0", "alembic>=1.12", "mysql-connector-python"],
+    "storage-sql-postgres": ["sqlalchemy>=2.0", "alembic>=1.12", "psycopg2"],
     # sqlite3 comes with python, so we don't need to install it.
-    "storage-sql-sqlite": ["sqlalchemy", "alembic"],
+    "storage-sql-sqlite": ["sqlalchemy>=2.0", "alembic>=1.12"],
+    # Faster (optional) parsing of the plain-JSON config files.
+    "orjson": ["orjson"],
     # Transitive extra_requires from mlos-core.
     "flaml": ["flaml[blendsearch]"],
     "smac": ["smac"],
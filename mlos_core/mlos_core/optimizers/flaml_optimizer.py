@@ -11,7 +11,7 @@ See the `Flaml Documentation <https://microsoft.github.io/FLAML/>`_ for more
 details.
 """
 
-from typing import NamedTuple
+from typing import TYPE_CHECKING, NamedTuple
 from warnings import warn
 
 import ConfigSpace
@@ -23,6 +23,9 @@ from mlos_core.optimizers.optimizer import BaseOptimizer
 from mlos_core.spaces.adapters.adapter import BaseSpaceAdapter
 from mlos_core.util import normalize_config
 
+if TYPE_CHECKING:
+    from flaml import BlendSearch
+
 
 class EvaluatedSample(NamedTuple):
     """A named tuple representing a sample that has been evaluated."""
@@ -31,6 +34,11 @@ class EvaluatedSample(NamedTuple):
     score: float
 
 
+def _config_key(config: dict) -> tuple:
+    """Get a cheap hashable key of the config (vs. making a ConfigSpace.Configuration)."""
+    return tuple(sorted(config.items()))
+
+
 class FlamlOptimizer(BaseOptimizer):
     """Wrapper class for FLAML Optimizer: A fast library for AutoML and tuning."""
 
@@ -38,6 +46,15 @@ class FlamlOptimizer(BaseOptimizer):
     # average of the user provided objective metrics.
     _METRIC_NAME = "FLAML_score"
 
+    # Max. number of extra attempts to get a new suggestion from the FLAML searcher
+    # (same as the default `max_failure` of `flaml.tune.run()`).
+    _MAX_SUGGEST_FAILURES = 100
+
+    # Max. number of pending (suggested, but not yet registered) configs to keep
+    # for the registration fast path. Suggestions of abandoned trials never get
+    # registered, so forget the oldest ones past that.
+    _MAX_PENDING_CONFIGS = 100
+
     def __init__(
         self,
         *,  # pylint: disable=too-many-arguments
@@ -97,8 +114,16 @@ class FlamlOptimizer(BaseOptimizer):
         )
         self.low_cost_partial_config = low_cost_partial_config
 
-        self.evaluated_samples: dict[ConfigSpace.Configuration, EvaluatedSample] = {}
-        self._suggested_config: dict | None
+        self.evaluated_samples: dict[tuple, EvaluatedSample] = {}
+        """
+        Evaluated samples, keyed by the `_config_key()` of their normalized config.
+
+        NOTE: This used to be keyed by the :py:class:`ConfigSpace.Configuration`
+        of the config. Use :py:attr:`EvaluatedSample.config` to get the config.
+        """
+
+        # Normalized configs of the suggestions that have not been registered yet.
+        self._pending_configs: dict[tuple, dict] = {}
 
     def _register(
         self,
@@ -141,17 +166,20 @@ class FlamlOptimizer(BaseOptimizer):
                 UserWarning,
             )
 
-        cs_config: ConfigSpace.Configuration = observation.to_suggestion().to_configspace_config(
-            self.optimizer_parameter_space
-        )
-        if cs_config in self.evaluated_samples:
-            warn(f"Configuration {cs_config} was already registered", UserWarning)
-        self.evaluated_samples[cs_config] = EvaluatedSample(
-            config=dict(cs_config),
-            score=float(
-                np.average(observation.score.astype(float), weights=self._objective_weights)
-            ),
-        )
+        # Fast path: the config of a pending suggestion (the common case in an
+        # ask-tell loop) is already normalized, so skip the (expensive)
+        # ConfigSpace round-trip for it.
+        config = self._pending_configs.pop(_config_key(observation.config.to_dict()), None)
+        if config is None:
+            config = dict(
+                observation.to_suggestion().to_configspace_config(self.optimizer_parameter_space)
+            )
+            self._pending_configs.pop(_config_key(config), None)
+        config_key = _config_key(config)
+        if config_key in self.evaluated_samples:
+            warn(f"Configuration {config} was already registered", UserWarning)
+        score = float(np.average(observation.score.astype(float), weights=self._objective_weights))
+        self.evaluated_samples[config_key] = EvaluatedSample(config=config, score=score)
 
     def _suggest(
         self,
@@ -181,83 +209,93 @@ class FlamlOptimizer(BaseOptimizer):
     def register_pending(self, pending: Suggestion) -> None:
         raise NotImplementedError()
 
-    def _target_function(self, config: dict) -> dict | None:
+    def _make_searcher(self) -> "BlendSearch":
         """
-        Configuration evaluation function called by FLAML optimizer.
-
-        FLAML may suggest the same configuration multiple times (due to its
-        warm-start mechanism).  Once FLAML suggests an unseen configuration, we
-        store it, and stop the optimization process.
+        Create a new FLAML searcher, warm-started with all the evaluated samples
+        and set up the same way :py:func:`flaml.tune.run` does it.
 
-        Parameters
-        ----------
-        config: dict
-            Next configuration to be evaluated, as suggested by FLAML.
-            This config is stored internally and is returned to user, via
-            `.suggest()` method.
+        For more info:
+        https://microsoft.github.io/FLAML/docs/Use-Cases/Tune-User-Defined-Function#warm-start
 
         Returns
         -------
-        result: dict | None
-            Dictionary with a single key, `FLAML_score`, if config already
-            evaluated; `None` otherwise.
+        searcher : BlendSearch
+            The same search algorithm :py:func:`flaml.tune.run` uses by default.
         """
-        cs_config = normalize_config(self.optimizer_parameter_space, config)
-        if cs_config in self.evaluated_samples:
-            return {self._METRIC_NAME: self.evaluated_samples[cs_config].score}
-
-        self._suggested_config = dict(cs_config)  # Cleaned-up version of the config
-        return None  # Returning None stops the process
+        from flaml import BlendSearch  # pylint: disable=import-outside-toplevel
+
+        # Parse evaluated configs to format used by FLAML.
+        # NOTE: The configs of the samples are already normalized on registration,
+        # so only (shallow) copy them here in case FLAML modifies them.
+        points_to_evaluate: list[dict] = []
+        evaluated_rewards: list[float] = []
+        for sample in self.evaluated_samples.values():
+            points_to_evaluate.append(dict(sample.config))
+            evaluated_rewards.append(sample.score)
+
+        return BlendSearch(
+            metric=self._METRIC_NAME,
+            mode="min",
+            space=self.flaml_parameter_space,
+            points_to_evaluate=points_to_evaluate,
+            evaluated_rewards=evaluated_rewards,
+            low_cost_partial_config=self.low_cost_partial_config,
+            # Budget for one new trial: BlendSearch picks between its global and
+            # local search threads based on the remaining budget.
+            num_samples=len(points_to_evaluate) + 1,
+        )
 
     def _get_next_config(self) -> dict:
         """
-        Warm-starts a new instance of FLAML, and returns a recommended, unseen new
+        Warm-starts a new FLAML searcher, and returns a recommended, unseen new
         configuration.
 
         Since FLAML does not provide an ask-and-tell interface, we need to create a
-        new instance of FLAML each time we get asked for a new suggestion. This is
-        suboptimal performance-wise, but works.
-        To do so, we use any previously evaluated configs to bootstrap FLAML (i.e.,
-        warm-start).
-        For more info:
-        https://microsoft.github.io/FLAML/docs/Use-Cases/Tune-User-Defined-Function#warm-start
+        new searcher each time we get asked for a new suggestion, warm-started with
+        any previously evaluated configs. We drive it directly instead of via
+        :py:func:`flaml.tune.run` to skip the overhead of its trial runner and
+        analysis, but keep the same searcher setup.
+
+        NOTE: Reusing one searcher across suggestions is cheaper still, but changes
+        its search trajectory and finds worse configs within small budgets.
+
+        FLAML may suggest the same configuration multiple times (due to its
+        warm-start mechanism), so we report the known scores for those back to it
+        (and retry) until it suggests an unseen configuration.
 
         Returns
         -------
         result: dict
-            A dictionary with a single key that is equal to the name of the optimization target,
-            if config already evaluated; `None` otherwise.
+            The (cleaned-up) configuration to evaluate next.
 
         Raises
         ------
         RuntimeError: if FLAML did not suggest a previously unseen configuration.
         """
-        from flaml import tune  # pylint: disable=import-outside-toplevel
-
-        # Parse evaluated configs to format used by FLAML
-        points_to_evaluate: list = []
-        evaluated_rewards: list = []
-        if len(self.evaluated_samples) > 0:
-            points_to_evaluate = [
-                dict(normalize_config(self.optimizer_parameter_space, conf))
-                for conf in self.evaluated_samples
-            ]
-            evaluated_rewards = [s.score for s in self.evaluated_samples.values()]
-
-        # Warm start FLAML optimizer
-        self._suggested_config = None
-        tune.run(
-            self._target_function,
-            config=self.flaml_parameter_space,
-            mode="min",
-            metric=self._METRIC_NAME,
-            points_to_evaluate=points_to_evaluate,
-            evaluated_rewards=evaluated_rewards,
-            num_samples=len(points_to_evaluate) + 1,
-            low_cost_partial_config=self.low_cost_partial_config,
-            verbose=0,
-        )
-        if self._suggested_config is None:
-            raise RuntimeError("FLAML did not produce a suggestion")
+        searcher = self._make_searcher()
+        # The loop below can replay all the evaluated samples, so hoist the lookups.
+        evaluated_samples = self.evaluated_samples
+        parameter_space = self.optimizer_parameter_space
+        metric_name = self._METRIC_NAME
+        for trial_num in range(len(evaluated_samples) + self._MAX_SUGGEST_FAILURES):
+            trial_id = str(trial_num)
+            flaml_config = searcher.suggest(trial_id)
+            if flaml_config is None:
+                continue  # The searcher may skip a turn, e.g., when starting a new thread.
+            # Fast path: FLAML returns the (already normalized) warm-start points as is.
+            sample = evaluated_samples.get(_config_key(flaml_config))
+            if sample is None:
+                config = dict(normalize_config(parameter_space, flaml_config))
+                config_key = _config_key(config)
+                sample = evaluated_samples.get(config_key)
+                if sample is None:
+                    if len(self._pending_configs) >= self._MAX_PENDING_CONFIGS:
+                        del self._pending_configs[next(iter(self._pending_configs))]
+                    self._pending_configs[config_key] = config
+                    return config  # Cleaned-up version of the config
+            searcher.on_trial_complete(
+                trial_id,
+                {metric_name: sample.score, "config": flaml_config},
+            )
 
-        return self._suggested_config  # type: ignore[unreachable]
+        raise RuntimeError("FLAML did not produce a suggestion")
@@ -0,0 +1,73 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Tests for FLAML optimizer."""
+
+import ConfigSpace as CS
+import pandas as pd
+import pytest
+
+from mlos_core.data_classes import Observations
+from mlos_core.optimizers.flaml_optimizer import FlamlOptimizer, _config_key
+from mlos_core.tests import SEED
+
+
+def test_flaml_pending_configs(configuration_space: CS.ConfigurationSpace) -> None:
+    """Make sure FLAML suggests unseen configs and keeps track of the pending ones
+    until they get registered.
+    """
+    # pylint: disable=protected-access
+    optimizer = FlamlOptimizer(
+        parameter_space=configuration_space,
+        optimization_targets=["score"],
+        seed=SEED,
+    )
+    suggestion = optimizer.suggest()
+    for i in range(5):
+        assert len(optimizer._pending_configs) == 1
+        optimizer.register(observations=suggestion.complete(pd.Series({"score": float(i)})))
+        assert not optimizer._pending_configs
+        (prev_suggestion, suggestion) = (suggestion, optimizer.suggest())
+    assert len(optimizer.evaluated_samples) == 5
+
+    # Re-registering a known config only updates its score.
+    with pytest.warns(UserWarning, match="already registered"):
+        optimizer.register(observations=prev_suggestion.complete(pd.Series({"score": 0.5})))
+    assert len(optimizer.evaluated_samples) == 5
+    assert len(optimizer._pending_configs) == 1
+
+    # Bulk register some random configs.
+    configs = pd.DataFrame(
+        [dict(config) for config in configuration_space.sample_configuration(3)]
+    )
+    optimizer.register(
+        observations=Observations(configs=configs, scores=pd.DataFrame({"score": [1.0] * 3}))
+    )
+    assert len(optimizer.evaluated_samples) == 8
+    optimizer.register(observations=suggestion.complete(pd.Series({"score": 0.0})))
+    assert not optimizer._pending_configs
+    assert len(optimizer.evaluated_samples) == 9
+
+
+def test_flaml_pending_configs_limit(configuration_space: CS.ConfigurationSpace) -> None:
+    """Make sure the suggestions that never get registered are not kept forever."""
+    # pylint: disable=protected-access
+    optimizer = FlamlOptimizer(
+        parameter_space=configuration_space,
+        optimization_targets=["score"],
+        seed=SEED,
+    )
+    optimizer._MAX_PENDING_CONFIGS = 3
+    # Suggestions of some abandoned trials.
+    optimizer._pending_configs = {(("x", i),): {"x": i} for i in range(3)}
+    suggestion = optimizer.suggest()
+    # The oldest pending config is forgotten.
+    assert list(optimizer._pending_configs) == [
+        (("x", 1),),
+        (("x", 2),),
+        _config_key(suggestion.config.to_dict()),
+    ]
+    optimizer.register(observations=suggestion.complete(pd.Series({"score": 1.0})))
+    assert len(optimizer._pending_configs) == 2
+    assert len(optimizer.evaluated_samples) == 1
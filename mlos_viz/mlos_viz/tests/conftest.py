@@ -14,4 +14,5 @@ exp_storage = sql_storage_fixtures.exp_storage
 exp_data = sql_storage_fixtures.exp_data
 
 tunable_groups_config = tunable_groups_fixtures.tunable_groups_config
+tunable_groups_template = tunable_groups_fixtures.tunable_groups_template
 tunable_groups = tunable_groups_fixtures.tunable_groups